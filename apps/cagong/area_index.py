@@ -0,0 +1,86 @@
+import json
+
+from apps.cagong.models import Area
+from common.cache import VersionStamp, VersionedSnapshot
+
+EMPTY_LIST = b"[]"
+
+# Area 데이터가 바뀌면(crawlareas, 지역 생성/수정/삭제 API) bump 해야 한다.
+area_index_version = VersionStamp("cagong:area_index:version")
+
+
+def _dumps(data):
+    # rest_framework의 JSONRenderer와 같은 형식으로 직렬화
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# AreaIndex 클래스 정의: 시/도 → 시군구 → 읍면동 트리와 노드별 JSON 응답
+class AreaIndex:
+    def __init__(self, rows):
+        # dict를 순서가 유지되는 distinct 집합으로 사용
+        cities = {}
+        counties = {}
+        towns = {}
+        for pk, city_code, city_name, county_code, county_name, town_code, town_name in rows:
+            cities[(city_code, city_name)] = None
+            counties.setdefault(city_code, {})[(county_code, county_name)] = None
+            towns.setdefault((city_code, county_code), []).append(
+                {"id": pk, "town_code": town_code, "town_name": town_name}
+            )
+
+        self.cities = _dumps(
+            [{"city_code": code, "city_name": name} for code, name in cities]
+        )
+        self.counties = {
+            city_code: _dumps(
+                [
+                    {
+                        "city_code": city_code,
+                        "county_code": code,
+                        "county_name": name,
+                    }
+                    for code, name in items
+                ]
+            )
+            for city_code, items in counties.items()
+        }
+        self.towns = {key: _dumps(items) for key, items in towns.items()}
+
+    @classmethod
+    def build(cls):
+        rows = (
+            Area.objects.filter(is_active=True)
+            .order_by("city_code", "county_code", "town_code")
+            .values_list(
+                "id",
+                "city_code",
+                "city_name",
+                "county_code",
+                "county_name",
+                "town_code",
+                "town_name",
+            )
+        )
+        return cls(rows)
+
+    def city_list(self):
+        return self.cities
+
+    def county_list(self, city_code):
+        return self.counties.get(city_code, EMPTY_LIST)
+
+    def town_list(self, city_code, county_code):
+        return self.towns.get((city_code, county_code), EMPTY_LIST)
+
+
+_snapshot = VersionedSnapshot(area_index_version, AreaIndex.build)
+
+
+def get_area_index():
+    # 버전이 바뀌지 않았다면 DB를 조회하지 않고 프로세스 메모리의 인덱스를 반환
+    return _snapshot.get()
+
+
+async def aget_area_index():
+    # get_area_index의 비동기 버전 (인덱스가 최신이면 sync 스레드를 거치지 않음)
+    return await _snapshot.aget()
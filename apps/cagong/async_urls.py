@@ -0,0 +1,27 @@
+from django.urls import path
+from .async_views import *
+
+# apps/cagong/urls.py의 읽기 전용 API와 같은 경로를 비동기 뷰로 제공
+urlpatterns = [
+    # Area 관련 API
+    path("areas/cities/", AsyncCityListView.as_view(), name="async-city-name-list"),
+    path(
+        "areas/cities/<int:city_code>/counties/",
+        AsyncCountyListView.as_view(),
+        name="async-county-name-list",
+    ),
+    path(
+        "areas/counties/<int:city_code>/<int:county_code>/towns/",
+        AsyncTownListView.as_view(),
+        name="async-town-name-list",
+    ),
+    # Cafe 관련 API
+    path("cafes/areas/", AsyncCafeListView.as_view(), name="async-cafe-list"),
+    path("cafes/counts/", AsyncCafeCountsView.as_view(), name="async-cafe-counts"),
+    path("cafes/<int:pk>/", AsyncCafeDetailView.as_view(), name="async-cafe-detail"),
+    path(
+        "cafes/<int:pk>/reviews/",
+        AsyncCafeReviewListView.as_view(),
+        name="async-cafe-review-list",
+    ),
+]
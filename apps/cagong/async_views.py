@@ -0,0 +1,144 @@
+import json
+
+from django.http import JsonResponse
+from django.views import View
+from rest_framework.exceptions import APIException
+
+from apps.cagong.area_index import aget_area_index
+from apps.cagong.models import Cafe, Review
+from apps.cagong.pagination import AsyncPageNumberPagination, CagongCursorPagination
+from apps.cagong.serializers import (
+    CafeCountsQuerySerializer,
+    CafeListSerializer,
+    CafeSerializer,
+    ReviewSerializer,
+)
+from apps.cagong.views import aget_cafe_counts, get_requested_fields, json_bytes_response
+
+
+# 읽기 전용 API의 ASGI(비동기) 버전
+# DRF APIView는 비동기 핸들러를 지원하지 않으므로 Django View의 async def 핸들러로 구현
+# 응답 형식은 apps/cagong/views.py의 동기 버전과 같다. (config/urls.py의 api/async/cagong/)
+# 인증이 필요 없는 조회 API만 제공하며, 직렬화는 쿼리가 끝난 객체에 대해서만 수행한다.
+
+
+def json_response(data, status=200):
+    # DRF JSONRenderer와 같이 한글을 이스케이프하지 않음
+    return JsonResponse(
+        data, status=status, safe=False, json_dumps_params={"ensure_ascii": False}
+    )
+
+
+# AsyncAPIView 클래스 정의: DRF 예외(NotFound 등)를 JSON 응답으로 변환
+class AsyncAPIView(View):
+    http_method_names = ["get", "options"]
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # DRF APIView와 같이 CSRF 검사 제외 (세션 인증을 사용하지 않음)
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as e:
+            return json_response({"detail": e.detail}, status=e.status_code)
+
+
+# Area 관련 API
+class AsyncCityListView(AsyncAPIView):
+    async def get(self, request):
+        # 지역 인덱스는 버전이 바뀔 때만 DB에서 다시 만들어지므로 대부분 메모리에서 응답
+        area_index = await aget_area_index()
+        return json_bytes_response(area_index.city_list())
+
+
+class AsyncCountyListView(AsyncAPIView):
+    async def get(self, request, city_code):
+        area_index = await aget_area_index()
+        return json_bytes_response(area_index.county_list(city_code))
+
+
+class AsyncTownListView(AsyncAPIView):
+    async def get(self, request, city_code, county_code):
+        area_index = await aget_area_index()
+        return json_bytes_response(area_index.town_list(city_code, county_code))
+
+
+# Cafe 관련 API
+class AsyncCafeListView(AsyncAPIView):
+    async def get(self, request):
+        area_id = request.GET.get("area_id", None)
+        fields = get_requested_fields(request)
+
+        cafes = Cafe.objects.select_related("area").filter(is_active=True)
+        if area_id:
+            cafes = cafes.filter(area__id=area_id)
+        cafes = cafes.order_by("-cagong", "id")
+
+        if "cursor" in request.GET:
+            # cursor를 보낸 클라이언트만 키셋 페이지네이션 사용 ({next, results})
+            paginator = CagongCursorPagination()
+        else:
+            # 기본: 기존 클라이언트와 같은 페이지 번호 방식 ({count, next, previous, results})
+            paginator = AsyncPageNumberPagination()
+        result_page = await paginator.apaginate_queryset(cafes, request)
+
+        serializer = CafeListSerializer(result_page, many=True, fields=fields)
+        return json_response(paginator.get_paginated_data(serializer.data))
+
+
+class AsyncCafeDetailView(AsyncAPIView):
+    async def get(self, request, pk):
+        try:
+            cafe = await (
+                Cafe.objects.select_related("area")
+                .prefetch_related("reviews")
+                .aget(pk=pk)
+            )
+        except Cafe.DoesNotExist:
+            return json_response({"error": "Cafe not found"}, status=404)
+        return json_response(CafeSerializer(cafe).data)
+
+
+class AsyncCafeReviewListView(AsyncAPIView):
+    async def get(self, request, pk):
+        if not await Cafe.objects.filter(pk=pk).aexists():
+            return json_response({"error": "Cafe not found"}, status=404)
+
+        # 직렬화 중 쿼리가 발생하지 않도록 작성자와 카페를 함께 조회
+        reviews = (
+            Review.objects.select_related("user", "cafe")
+            .filter(cafe_id=pk, is_active=True)
+            .order_by("-created_at")
+        )
+
+        paginator = AsyncPageNumberPagination()
+        result_page = await paginator.apaginate_queryset(reviews, request)
+
+        serializer = ReviewSerializer(result_page, many=True)
+        return json_response(paginator.get_paginated_data(serializer.data))
+
+
+class AsyncCafeCountsView(AsyncAPIView):
+    http_method_names = ["get", "post", "options"]
+
+    async def get(self, request):
+        ids = [pk for pk in request.GET.get("ids", "").split(",") if pk]
+        return await self.get_counts_response({"ids": ids})
+
+    async def post(self, request):
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return json_response({"detail": "JSON parse error"}, status=400)
+        return await self.get_counts_response(data)
+
+    async def get_counts_response(self, data):
+        serializer = CafeCountsQuerySerializer(data=data)
+        if not serializer.is_valid():
+            return json_response(serializer.errors, status=400)
+        ids = list(dict.fromkeys(serializer.validated_data["ids"]))  # 중복 제거
+        return json_response(await aget_cafe_counts(ids))
@@ -0,0 +1,162 @@
+import heapq
+import json
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+from apps.cagong.models import Cafe
+from common.cache import VersionStamp, VersionedSnapshot
+
+EMPTY_LIST = b"[]"
+MAX_LIMIT = 20
+# 이 길이 이하의 접두어는 상위 MAX_LIMIT개를 미리 계산 (짧은 접두어일수록 후보가 많음)
+PRECOMPUTED_PREFIX_LENGTH = 3
+MAX_ADDR_WORDS = 6
+
+# 카페 이름, 주소, 카공 점수가 바뀌면(crawlcafes, 카페 생성/수정/삭제 API) bump 해야 한다.
+cafe_index_version = VersionStamp("cagong:cafe_index:version")
+
+re_space = re.compile(r"\s+")
+
+
+def normalize(text):
+    # 대소문자, 전각/반각, 공백 차이를 무시하고 비교
+    return re_space.sub("", unicodedata.normalize("NFKC", text or "").lower())
+
+
+def index_keys(name, addr):
+    # 이름과 주소의 각 어절에서 시작하는 문자열을 키로 사용
+    # 예) "스타벅스 광화문점" → "스타벅스광화문점", "광화문점"
+    keys = set()
+    for text, max_words in ((name, None), (addr, MAX_ADDR_WORDS)):
+        words = re_space.split(unicodedata.normalize("NFKC", text or "").lower().strip())
+        words = [word for word in words if word][:max_words]
+        for i in range(len(words)):
+            keys.add("".join(words[i:]))
+    keys.discard("")
+    return keys
+
+
+def _dumps(data):
+    # rest_framework의 JSONRenderer와 같은 형식으로 직렬화
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# CafeIndex 클래스 정의: 활성 카페의 이름/주소 접두어 검색용 정렬 배열
+# 카페는 카공 점수 순위(rank)로 저장하고, 키 배열을 이분 탐색해 접두어가 같은 구간을 찾은 뒤
+# 그 구간에서 순위가 가장 높은 카페들을 반환한다.
+class CafeIndex:
+    def __init__(self, rows):
+        # rows: 카공 점수 순으로 정렬된 (id, name, addr, cagong, area_id)
+        self.items = []
+        entries = []
+        top = {}  # 짧은 접두어: 상위 카페 순위 목록
+        for rank, (pk, name, addr, cagong, area_id) in enumerate(rows):
+            self.items.append(
+                _dumps(
+                    {
+                        "id": pk,
+                        "name": name,
+                        "addr": addr,
+                        "cagong": cagong,
+                        "area_id": area_id,
+                    }
+                )
+            )
+            keys = index_keys(name, addr)
+            prefixes = set()
+            for key in keys:
+                entries.append((key, rank))
+                prefixes.update(
+                    key[:length] for length in range(1, PRECOMPUTED_PREFIX_LENGTH + 1)
+                )
+            # 순위 순으로 순회하므로 먼저 들어간 카페가 상위 카페
+            for prefix in prefixes:
+                ranks = top.setdefault(prefix, [])
+                if len(ranks) < MAX_LIMIT:
+                    ranks.append(rank)
+
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.ranks = array("i", (rank for _, rank in entries))
+        self.top = {prefix: tuple(ranks) for prefix, ranks in top.items()}
+        self.tree = self._build_min_tree(self.ranks)
+
+    @staticmethod
+    def _build_min_tree(ranks):
+        # 구간 최솟값 세그먼트 트리: tree[i]는 노드 i 구간에서 순위가 가장 높은 항목의 위치
+        # (리프는 tree[n + i] = i)
+        n = len(ranks)
+        tree = array("i", [0]) * n + array("i", range(n))
+        for i in range(n - 1, 0, -1):
+            left, right = tree[2 * i], tree[2 * i + 1]
+            tree[i] = left if ranks[left] <= ranks[right] else right
+        return tree
+
+    def _range_min(self, lo, hi):
+        # ranks[lo:hi]에서 순위가 가장 높은 항목의 위치 (O(log N))
+        ranks, tree, n = self.ranks, self.tree, len(self.ranks)
+        best = -1
+        lo, hi = lo + n, hi + n
+        while lo < hi:
+            if lo & 1:
+                if best < 0 or ranks[tree[lo]] < ranks[best]:
+                    best = tree[lo]
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                if best < 0 or ranks[tree[hi]] < ranks[best]:
+                    best = tree[hi]
+            lo, hi = lo // 2, hi // 2
+        return best
+
+    def _top_ranks(self, lo, hi, limit):
+        # ranks[lo:hi]의 서로 다른 순위 중 상위 limit개
+        # 구간 전체를 복사하지 않고, (구간 최솟값, 구간) 힙에서 꺼낸 위치를 기준으로 구간을 나눔
+        i = self._range_min(lo, hi)
+        heap = [(self.ranks[i], i, lo, hi)]
+        ranks = []
+        while heap and len(ranks) < limit:
+            rank, i, lo, hi = heapq.heappop(heap)
+            # 한 카페가 여러 키로 걸릴 수 있으므로 중복 제거
+            if rank not in ranks:
+                ranks.append(rank)
+            for start, end in ((lo, i), (i + 1, hi)):
+                if start < end:
+                    j = self._range_min(start, end)
+                    heapq.heappush(heap, (self.ranks[j], j, start, end))
+        return ranks
+
+    @classmethod
+    def build(cls):
+        rows = (
+            Cafe.objects.filter(is_active=True)
+            .order_by("-cagong", "id")
+            .values_list("id", "name", "addr", "cagong", "area_id")
+        )
+        return cls(rows.iterator(chunk_size=5000))
+
+    def search(self, query, limit=10):
+        # 접두어가 query인 카페들을 카공 점수 순으로 최대 limit개, JSON bytes로 반환
+        query = normalize(query)
+        limit = min(limit, MAX_LIMIT)
+        if not query:
+            return EMPTY_LIST
+        if len(query) <= PRECOMPUTED_PREFIX_LENGTH:
+            ranks = self.top.get(query, ())[:limit]
+        else:
+            lo = bisect_left(self.keys, query)
+            hi = bisect_left(self.keys, query + "\U0010ffff", lo)
+            ranks = self._top_ranks(lo, hi, limit) if lo < hi else ()
+        return b"[" + b",".join(self.items[rank] for rank in ranks) + b"]"
+
+
+# 전체 카페를 읽어 다시 만드는 데 시간이 걸리므로, 버전이 바뀌면 이전 인덱스로 응답하면서
+# 백그라운드 스레드에서 새 인덱스를 만든 뒤 교체
+_snapshot = VersionedSnapshot(cafe_index_version, CafeIndex.build, background=True)
+
+
+def get_cafe_index():
+    # 버전이 바뀌지 않았다면 DB를 조회하지 않고 프로세스 메모리의 인덱스를 반환
+    return _snapshot.get()
@@ -0,0 +1,26 @@
+import math
+
+from django.db.models import ExpressionWrapper, F, FloatField, Value
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_M = 6371008.8
+
+
+def bounding_box(lat, lng, radius):
+    # 반경 radius(m)의 원을 감싸는 위경도 범위 (인덱스 범위 조회용)
+    lat_delta = math.degrees(radius / EARTH_RADIUS_M)
+    # 극지방에서 경도 범위가 무한대로 커지지 않도록 cos 하한 지정
+    lng_delta = lat_delta / max(math.cos(math.radians(lat)), 0.01)
+    return (lat - lat_delta, lat + lat_delta), (lng - lng_delta, lng + lng_delta)
+
+
+def haversine_distance(lat, lng, lat_field="lat", lng_field="lng"):
+    # (lat, lng)와 각 행 좌표 사이의 대원 거리(m)를 계산하는 SQL 식
+    half_dlat = Radians(F(lat_field) - Value(lat)) / Value(2.0)
+    half_dlng = Radians(F(lng_field) - Value(lng)) / Value(2.0)
+    a = Power(Sin(half_dlat), 2) + Value(math.cos(math.radians(lat))) * Cos(
+        Radians(F(lat_field))
+    ) * Power(Sin(half_dlng), 2)
+    return ExpressionWrapper(
+        Value(2 * EARTH_RADIUS_M) * ASin(Sqrt(a)), output_field=FloatField()
+    )
@@ -0,0 +1,96 @@
+import logging
+import os
+import time
+from functools import partial
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max, Min
+from apps.cagong.models import Cafe, Review
+from apps.cagong.wordcloud import build_wordclouds
+from common.db import bulk_update_from_values
+from common.jobs import TASKS_PER_WORKER, Watermark, changed_since, run_tasks
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+WATERMARK_NAME = "build_wordclouds"
+
+
+class Command(BaseCommand):
+    help = "카페별 활성 리뷰의 상위 단어를 계산해 Cafe.wordcloud에 JSON으로 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="마지막 실행 시점과 관계없이 모든 활성 카페를 다시 계산",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="카페 id 구간별 계산에 사용할 프로세스 수 (1이면 현재 프로세스에서 실행)",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=5000, help="서버 사이드 커서로 한 번에 읽을 리뷰 수"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=2000, help="한 번의 UPDATE로 반영할 카페 수"
+        )
+
+    def full_tasks(self, count):
+        # 활성 카페 id 범위를 count개의 [start, end) 구간으로 분할
+        bounds = Cafe.objects.aggregate(start=Min("id"), end=Max("id"))
+        if bounds["start"] is None:
+            return []
+        start, end = bounds["start"], bounds["end"] + 1
+        step = max((end - start + count - 1) // count, 1)
+        return [(lo, min(lo + step, end), None) for lo in range(start, end, step)]
+
+    def incremental_tasks(self, since, count):
+        # since 이후 리뷰가 작성/수정/삭제된 활성 카페를 id 순으로 count개 묶음으로 분할
+        changed = changed_since(Review, since).values("cafe_id")
+        cafe_ids = list(
+            Cafe.objects.filter(id__in=changed).order_by("id").values_list("id", flat=True)
+        )
+        logger.info(f"#### {since} 이후 리뷰가 바뀐 카페 {len(cafe_ids)}개")
+        step = max((len(cafe_ids) + count - 1) // count, 1)
+        return [
+            (ids[0], ids[-1] + 1, ids)
+            for ids in (cafe_ids[i : i + step] for i in range(0, len(cafe_ids), step))
+        ]
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        watermark = Watermark(WATERMARK_NAME)
+        workers = max(options["workers"], 1)
+        build = partial(build_wordclouds, chunk_size=options["chunk_size"])
+
+        since = None if options["full"] else watermark.get()
+        if since is None:
+            tasks = self.full_tasks(workers * TASKS_PER_WORKER)
+            logger.info("#### 전체 카페의 워드클라우드를 계산합니다.")
+        else:
+            tasks = self.incremental_tasks(since, workers * TASKS_PER_WORKER)
+
+        wordclouds = run_tasks(build, tasks, workers)
+        logger.info(
+            f"#### 워드클라우드 계산 완료: {len(wordclouds)}개 카페, "
+            f"{time.perf_counter() - start:.1f}초"
+        )
+
+        # 계산이 모두 끝난 뒤 바뀐 카페만 워터마크와 같은 짧은 트랜잭션에서 갱신
+        # (계산 중에는 카페 행을 잠그지 않음)
+        with watermark.advance():
+            updated = bulk_update_from_values(
+                Cafe,
+                ["wordcloud"],
+                wordclouds,
+                where="t.wordcloud IS DISTINCT FROM v.wordcloud",
+                batch_size=options["batch_size"],
+            )
+
+        logger.info(
+            f"#### 워드클라우드 갱신 완료: {len(wordclouds)}개 카페 중 {updated}개 변경, "
+            f"{time.perf_counter() - start:.1f}초"
+        )
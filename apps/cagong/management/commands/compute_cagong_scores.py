@@ -0,0 +1,114 @@
+import logging
+import os
+import time
+from functools import partial
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from apps.cagong.models import Cafe, Review
+from apps.cagong.cafe_index import cafe_index_version
+from apps.cagong.scoring import score_cafes
+from common.db import bulk_update_from_values
+from common.jobs import TASKS_PER_WORKER, Watermark, changed_since, run_tasks
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+WATERMARK_NAME = "compute_cagong_scores"
+
+
+def split_tasks(area_sizes, count):
+    # {area_id: 카페 수}를 카페 수 합이 비슷한 count개의 지역 묶음으로 분배 (큰 지역부터)
+    tasks = [[0, []] for _ in range(min(count, len(area_sizes)))]
+    for area_id, size in sorted(area_sizes.items(), key=lambda item: -item[1]):
+        task = min(tasks, key=lambda task: task[0])
+        task[0] += size
+        task[1].append(area_id)
+    return [area_ids for _, area_ids in tasks]
+
+
+class Command(BaseCommand):
+    help = (
+        "리뷰 본문의 키워드(콘센트, 와이파이, 조용함, 좌석, 영업시간)로 카페의 카공 점수를 "
+        "다시 계산합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="마지막 실행 이후 리뷰가 작성/수정/삭제된 카페만 다시 계산",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="지역별 계산에 사용할 프로세스 수 (1이면 현재 프로세스에서 실행)",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=5000, help="서버 사이드 커서로 한 번에 읽을 리뷰 수"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=10000, help="한 번의 UPDATE로 반영할 카페 수"
+        )
+
+    def target_cafes(self, since):
+        # 증분 실행: since 이후 리뷰가 바뀐 활성 카페의 {area_id: [cafe_id, ...]}
+        changed = changed_since(Review, since).values("cafe_id")
+        targets = {}
+        for cafe_id, area_id in Cafe.objects.filter(id__in=changed).values_list(
+            "id", "area_id"
+        ):
+            targets.setdefault(area_id, []).append(cafe_id)
+        return targets
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        watermark = Watermark(WATERMARK_NAME)
+        workers = max(options["workers"], 1)
+        score = partial(score_cafes, chunk_size=options["chunk_size"])
+
+        since = watermark.get() if options["incremental"] else None
+        if since is not None:
+            targets = self.target_cafes(since)
+            area_sizes = {area_id: len(ids) for area_id, ids in targets.items()}
+            logger.info(f"#### {since} 이후 리뷰가 바뀐 카페 {sum(area_sizes.values())}개")
+        else:
+            targets = None
+            area_sizes = dict(
+                Cafe.objects.order_by()
+                .values("area_id")
+                .annotate(count=Count("id"))
+                .values_list("area_id", "count")
+            )
+            logger.info(f"#### 전체 카페 {sum(area_sizes.values())}개")
+
+        tasks = []
+        for area_ids in split_tasks(area_sizes, workers * TASKS_PER_WORKER):
+            cafe_ids = None
+            if targets is not None:
+                cafe_ids = [cafe_id for area_id in area_ids for cafe_id in targets[area_id]]
+            tasks.append((area_ids, cafe_ids))
+
+        scores = run_tasks(score, tasks, workers)
+        logger.info(
+            f"#### 카공 점수 계산 완료: {len(scores)}개 카페, {time.perf_counter() - start:.1f}초"
+        )
+
+        # 점수가 바뀐 카페만 워터마크와 같은 트랜잭션에서 갱신
+        with watermark.advance():
+            updated = bulk_update_from_values(
+                Cafe,
+                ["cagong"],
+                scores,
+                where="t.cagong IS DISTINCT FROM v.cagong",
+                batch_size=options["batch_size"],
+            )
+            if updated:
+                transaction.on_commit(cafe_index_version.bump)
+
+        logger.info(
+            f"#### 카공 점수 갱신 완료: {updated}개 카페 변경, "
+            f"{time.perf_counter() - start:.1f}초"
+        )
@@ -1,8 +1,13 @@
 from django.db import transaction
 from django.core.management.base import BaseCommand
 from apps.cagong.models import Area
+from apps.cagong.area_index import area_index_version
 
 import logging
+import time
+
+import numpy as np
+import pandas as pd
 
 from datetime import datetime
 from common.utils import get_dataframe_from_s3
@@ -14,46 +19,113 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 bucket = "ca-devbucket"
 file_key = "gisp-data-20240606/area.parquet"
 
+CODE_COLUMNS = ["city_code", "county_code", "town_code"]
+VALUE_COLUMNS = [
+    "city_code",
+    "city_name",
+    "county_code",
+    "county_name",
+    "town_code",
+    "town_name",
+]
+# 10, 100, ..., 10^18: 정수의 자릿수를 searchsorted로 구하기 위한 경계값
+POWERS_OF_TEN = 10 ** np.arange(1, 19, dtype=np.int64)
+
+
+def digit_count(values):
+    # 문자열 변환 없이 각 정수의 10진수 자릿수 계산 (0은 1자리)
+    return np.searchsorted(POWERS_OF_TEN, values, side="right") + 1
+
+
+def compose_area_id(city_code, county_code, town_code):
+    # str(city) + str(county) + str(town)을 정수 연산으로 계산
+    city_code = np.asarray(city_code, dtype=np.int64)
+    county_code = np.asarray(county_code, dtype=np.int64)
+    town_code = np.asarray(town_code, dtype=np.int64)
+    town_shift = 10 ** digit_count(town_code)
+    county_shift = 10 ** digit_count(county_code)
+    return (city_code * county_shift + county_code) * town_shift + town_code
+
 
 class Command(BaseCommand):
     help = "crawl areas"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="bulk insert/update 배치 크기"
+        )
+
     def extract_process(self):
         logger.info("#### Start to extract, process data")
         df = get_dataframe_from_s3(bucket, file_key)
-        df["id"] = (
-            df["city_code"].astype(str)
-            + df["county_code"].astype(str)
-            + df["town_code"].astype(str)
-        ).astype(int)
-
+        df[CODE_COLUMNS] = df[CODE_COLUMNS].astype(np.int64)
+        df["id"] = compose_area_id(
+            df["city_code"], df["county_code"], df["town_code"]
+        )
         df["county_name"] = df["county_name"].fillna("")
+        df = df.drop_duplicates("id", keep="last")
         logger.info("#### Success to process data")
         return df
 
-    def load(self, df):
+    def diff(self, df):
+        # 기존 행을 한 번의 쿼리로 읽어 신규/변경/동일 행으로 분류
+        existing = pd.DataFrame.from_records(
+            Area.all_objects.values_list("id", *VALUE_COLUMNS),
+            columns=["id", *VALUE_COLUMNS],
+        )
+        merged = df[["id", *VALUE_COLUMNS]].merge(
+            existing, on="id", how="left", suffixes=("", "_old"), indicator=True
+        )
+        is_new = merged["_merge"] == "left_only"
+        changed = np.zeros(len(merged), dtype=bool)
+        for column in VALUE_COLUMNS:
+            changed |= (merged[column] != merged[f"{column}_old"]).to_numpy()
+        columns = ["id", *VALUE_COLUMNS]
+        inserts = merged.loc[is_new, columns]
+        updates = merged.loc[~is_new & changed, columns]
+        unchanged = int((~is_new & ~changed).sum())
+        return inserts, updates, unchanged
+
+    def load(self, inserts, updates, batch_size):
         logger.info(f"#### Start to load..")
+        now = datetime.now()
+        timings = {}
         with transaction.atomic():
-            for _, row in df.iterrows():
-                obj, created = Area.objects.update_or_create(
-                    id=row["id"],
-                    defaults={
-                        "id": row["id"],
-                        "city_code": row["city_code"],
-                        "city_name": row["city_name"],
-                        "county_code": row["county_code"],
-                        "county_name": row["county_name"],
-                        "town_code": row["town_code"],
-                        "town_name": row["town_name"],
-                        "updated_at": datetime.now(),
-                    },
-                )
-                if created:
-                    logger.info(f"Created: {obj}")
-                else:
-                    logger.info(f"Updated: {obj}")
+            started = time.perf_counter()
+            Area.objects.bulk_create(
+                [Area(**row) for row in inserts.to_dict(orient="records")],
+                batch_size=batch_size,
+            )
+            timings["insert"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            Area.all_objects.bulk_update(
+                [
+                    Area(updated_at=now, **row)
+                    for row in updates.to_dict(orient="records")
+                ],
+                [*VALUE_COLUMNS, "updated_at"],
+                batch_size=batch_size,
+            )
+            timings["update"] = time.perf_counter() - started
+        area_index_version.bump()
         logger.info(f"#### Success to load data to Area table")
+        return timings
 
     def handle(self, **options):
+        started = time.perf_counter()
         df = self.extract_process()
-        self.load(df)
+        extract_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        inserts, updates, unchanged = self.diff(df)
+        diff_time = time.perf_counter() - started
+
+        timings = self.load(inserts, updates, options["batch_size"])
+        logger.info(
+            f"#### inserted={len(inserts)} updated={len(updates)} unchanged={unchanged}"
+        )
+        logger.info(
+            f"#### extract={extract_time:.2f}s diff={diff_time:.2f}s "
+            f"insert={timings['insert']:.2f}s update={timings['update']:.2f}s"
+        )
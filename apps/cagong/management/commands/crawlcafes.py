@@ -1,8 +1,10 @@
-from django.db import transaction
+from django.db import connection, transaction
 from django.core.management.base import BaseCommand
 from apps.cagong.models import Cafe
-from common.utils import get_dataframe_from_s3
+from apps.cagong.cafe_index import cafe_index_version
+from common.utils import iter_parquet_batches_from_s3
 
+import hashlib
 import logging
 
 from datetime import datetime
@@ -10,43 +12,167 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+bucket = "ca-devbucket"
+file_key = "gisp-data-20240606/cafe.parquet"
+
+# parquet 컬럼 → Cafe 필드
+SOURCE_COLUMNS = {
+    "v_rid": "crawl_id",
+    "nm": "name",
+    "addr": "addr",
+    "phone": "phone",
+    "lat": "lat",
+    "lng": "lng",
+    "area_id": "area_id",
+}
+FINGERPRINT_FIELDS = ["name", "addr", "phone", "lat", "lng", "area_id"]
+UPDATE_FIELDS = [
+    "is_crawled",
+    "name",
+    "addr",
+    "phone",
+    "lat",
+    "lng",
+    "area",
+    "fingerprint",
+    "updated_at",
+]  # is_active, deleted_at은 갱신하지 않음 (관리자가 삭제한 카페는 삭제 상태 유지)
+# 스냅샷에 없어서 soft_delete_missing이 삭제한 카페의 지문 (다시 나타나면 복구 대상)
+MISSING_FINGERPRINT = ""
+SNAPSHOT_TABLE = "crawlcafes_snapshot"
+
+
+def fingerprint(row):
+    # 원본 값의 안정적인 해시: None은 빈 문자열, 구분자는 Unit Separator
+    payload = "\x1f".join(
+        "" if row[field] is None else str(row[field]) for field in FINGERPRINT_FIELDS
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
 
 class Command(BaseCommand):
     help = "crawl cafes"
 
-    def extract(self):
-        logger.info(f"#### Start to extract data")
-        bucket = "ca-devbucket"
-        file_key = "gisp-data-20240606/cafe.parquet"
-        df = get_dataframe_from_s3(bucket, file_key)
-        logger.info(f"#### Success to extract data")
-        return df
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="한 번에 읽고 저장할 행 수"
+        )
+        parser.add_argument(
+            "--delta",
+            action="store_true",
+            help="변경된 카페만 저장하고, 스냅샷에 없는 크롤링 카페는 소프트 삭제",
+        )
+
+    def extract(self, batch_size):
+        # row group 단위로 읽은 배치를 {crawl_id: Cafe 필드} 형태로 반환
+        for batch in iter_parquet_batches_from_s3(
+            bucket, file_key, columns=list(SOURCE_COLUMNS), batch_size=batch_size
+        ):
+            columns = [batch.column(name).to_pylist() for name in SOURCE_COLUMNS]
+            rows = {}
+            for values in zip(*columns):
+                row = dict(zip(SOURCE_COLUMNS.values(), values))
+                row["fingerprint"] = fingerprint(row)
+                # 같은 배치 안의 중복 crawl_id는 마지막 행만 사용 (ON CONFLICT 제약)
+                rows[row["crawl_id"]] = row
+            yield rows
+
+    def diff_rows(self, rows):
+        # (새로 쓰거나 바뀐 행, 복구할 crawl_id) 배치당 한 번의 조회
+        # 지문이 같으면 삭제 여부와 관계없이 변경 없음으로 보고,
+        # 스냅샷에서 빠져 삭제됐던 카페만 복구한다.
+        existing = dict(
+            Cafe.all_objects.filter(crawl_id__in=list(rows)).values_list(
+                "crawl_id", "fingerprint"
+            )
+        )
+        changed = [
+            row
+            for crawl_id, row in rows.items()
+            if existing.get(crawl_id) != row["fingerprint"]
+        ]
+        missing = [
+            crawl_id
+            for crawl_id, value in existing.items()
+            if value == MISSING_FINGERPRINT
+        ]
+        return changed, missing
 
-    def load(self, df):
+    def upsert(self, rows):
+        now = datetime.now()
+        Cafe.objects.bulk_create(
+            [Cafe(is_crawled=True, updated_at=now, **row) for row in rows],
+            update_conflicts=True,
+            unique_fields=["crawl_id"],
+            update_fields=UPDATE_FIELDS,
+        )
+
+    def create_snapshot_table(self, cursor):
+        # 이번 스냅샷의 crawl_id 목록을 담는 임시 테이블 (트랜잭션이 끝나면 삭제)
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {SNAPSHOT_TABLE} "
+            f"(crawl_id varchar(20) PRIMARY KEY) ON COMMIT DROP"
+        )
+
+    def add_to_snapshot(self, cursor, crawl_ids):
+        cursor.execute(
+            f"INSERT INTO {SNAPSHOT_TABLE} (crawl_id) "
+            f"SELECT unnest(%s::varchar[]) ON CONFLICT DO NOTHING",
+            [crawl_ids],
+        )
+
+    def soft_delete_missing(self, cursor):
+        # 이번 스냅샷에 없는 활성 크롤링 카페를 임시 테이블과의 NOT EXISTS 조인으로 찾아 소프트 삭제
+        # 다시 나타났을 때 복구할 수 있도록 지문을 MISSING_FINGERPRINT로 표시
+        table = Cafe._meta.db_table
+        cursor.execute(
+            f"UPDATE {table} AS c SET fingerprint = %s "
+            f"WHERE c.is_crawled AND c.is_active AND NOT EXISTS "
+            f"(SELECT 1 FROM {SNAPSHOT_TABLE} AS s WHERE s.crawl_id = c.crawl_id)",
+            [MISSING_FINGERPRINT],
+        )
+        return Cafe.objects.filter(
+            is_crawled=True, fingerprint=MISSING_FINGERPRINT
+        ).delete()
+
+    def load(self, batches, delta=False):
         logger.info(f"#### Start to load..")
-        with transaction.atomic():
-            for row in df.to_dict(orient="records"):
-                crawl_id = row["v_rid"]
-                _, created = Cafe.objects.update_or_create(
-                    crawl_id=crawl_id,
-                    defaults={
-                        "is_crawled": True,
-                        "crawl_id": crawl_id,
-                        "name": row["nm"],
-                        "addr": row["addr"],
-                        "phone": row["phone"],
-                        "lat": row["lat"],
-                        "lng": row["lng"],
-                        "area_id": row["area_id"],
-                        "updated_at": datetime.now(),
-                    },
-                )
-                if created:
-                    logger.info(f"Created: {crawl_id}")
+        seen = 0
+        written = 0
+        unchanged = 0
+        restored = 0
+        deleted = 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            if delta:
+                self.create_snapshot_table(cursor)
+            for rows in batches:
+                seen += len(rows)
+                changed, missing = self.diff_rows(rows)
+                if delta:
+                    self.add_to_snapshot(cursor, list(rows))
+                else:
+                    changed = list(rows.values())
+                if missing:
+                    # 연관된 리뷰, 찜도 함께 복구 (같은 시각에 삭제된 것만)
+                    restored += Cafe.objects.inactive().filter(crawl_id__in=missing).restore()
+                if changed:
+                    self.upsert(changed)
+                written += len(changed)
+                unchanged += len(rows) - len(changed)
+                logger.info(f"#### Written {written} rows, unchanged {unchanged} rows")
+            if delta:
+                if seen:
+                    deleted = self.soft_delete_missing(cursor)
                 else:
-                    logger.info(f"Updated: {crawl_id}")
-        logger.info(f"#### Success to load data to cafe table")
+                    # 빈 스냅샷으로 전체 카페가 삭제되는 것을 방지
+                    logger.warning("#### Empty snapshot, skip soft delete")
+            # 커밋 후 웹 프로세스의 자동완성 인덱스를 다시 만들도록 버전 변경
+            transaction.on_commit(cafe_index_version.bump)
+        logger.info(
+            f"#### Success to load data to cafe table (written={written}, "
+            f"unchanged={unchanged}, restored={restored}, deleted={deleted})"
+        )
 
     def handle(self, **options):
-        data = self.extract()
-        self.load(data)
+        logger.info(f"#### Start to extract data")
+        self.load(self.extract(options["batch_size"]), delta=options["delta"])
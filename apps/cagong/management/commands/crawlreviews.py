@@ -0,0 +1,139 @@
+from django.db import transaction
+from django.core.management.base import BaseCommand
+from apps.cagong.models import Cafe, Review
+from apps.cagong.search import build_search_vector
+from common.db import bulk_insert_ignore_conflicts
+from common.models import recount_counters
+from common.utils import iter_parquet_batches_from_s3
+
+import hashlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+bucket = "ca-devbucket"
+file_key = "gisp-data-20240606/review.parquet"
+
+# parquet 컬럼: 카페의 원본 id (Cafe.crawl_id), 리뷰 본문
+CAFE_ID_COLUMN = "v_rid"
+REVIEW_COLUMN = "review"
+MAX_ORPHAN_SAMPLES = 10
+
+
+def content_hash(crawl_id, text):
+    # 카페와 공백을 정리한 본문의 해시: 같은 카페의 같은 리뷰는 다시 적재하지 않음
+    payload = f"{crawl_id}\x1f{' '.join(text.split())}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class Command(BaseCommand):
+    help = "crawl reviews"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="한 번에 읽고 저장할 행 수"
+        )
+
+    def get_cafe_ids(self):
+        # crawl_id → Cafe.id (활성 크롤링 카페 전체를 한 번에 조회)
+        return dict(
+            Cafe.objects.filter(crawl_id__isnull=False).values_list("crawl_id", "id")
+        )
+
+    def extract(self, batch_size):
+        # row group 단위로 읽은 배치를 [(crawl_id, 리뷰 본문), ...] 형태로 반환
+        for batch in iter_parquet_batches_from_s3(
+            bucket, file_key, columns=[CAFE_ID_COLUMN, REVIEW_COLUMN], batch_size=batch_size
+        ):
+            yield list(
+                zip(
+                    batch.column(CAFE_ID_COLUMN).to_pylist(),
+                    batch.column(REVIEW_COLUMN).to_pylist(),
+                )
+            )
+
+    def new_reviews(self, rows, cafe_ids, stats):
+        # 카페를 찾을 수 없는 행, 빈 리뷰, 중복(배치 안, 이미 적재된 리뷰)을 제외한 Review 목록
+        reviews = {}
+        for crawl_id, text in rows:
+            if not text or not text.strip():
+                stats["empty"] += 1
+                continue
+            cafe_id = cafe_ids.get(crawl_id)
+            if cafe_id is None:
+                stats["orphans"] += 1
+                if len(stats["orphan_samples"]) < MAX_ORPHAN_SAMPLES:
+                    stats["orphan_samples"].add(crawl_id)
+                continue
+            key = content_hash(crawl_id, text)
+            if key in reviews:
+                stats["duplicates"] += 1
+                continue
+            reviews[key] = Review(
+                cafe_id=cafe_id,
+                review=text,
+                crawling=True,
+                content_hash=key,
+                # bulk_create는 save()를 거치지 않으므로 검색용 tsvector를 직접 설정
+                search_vector=build_search_vector(text),
+            )
+
+        # 이미 적재된 리뷰 제외 (배치당 한 번의 조회, 삭제된 리뷰도 다시 만들지 않음)
+        existing = set(
+            Review.all_objects.filter(content_hash__in=list(reviews)).values_list(
+                "content_hash", flat=True
+            )
+        )
+        stats["duplicates"] += len(existing)
+        return [review for key, review in reviews.items() if key not in existing]
+
+    def load(self, batches):
+        logger.info(f"#### Start to load..")
+        start = time.perf_counter()
+        cafe_ids = self.get_cafe_ids()
+        logger.info(f"#### Loaded {len(cafe_ids)} crawled cafe ids")
+
+        stats = {"read": 0, "written": 0, "duplicates": 0, "empty": 0, "orphans": 0}
+        stats["orphan_samples"] = set()
+        recounted = set()
+        for rows in batches:
+            reviews = self.new_reviews(rows, cafe_ids, stats)
+            # 배치마다 커밋: 중간에 실패해도 다시 실행하면 적재된 리뷰는 해시로 건너뜀
+            # ON CONFLICT DO NOTHING은 동시에 실행된 다른 적재와 겹친 행을 무시하고,
+            # 실제로 저장된 행만 돌려주므로 그 행 수를 written으로 센다.
+            with transaction.atomic():
+                inserted = bulk_insert_ignore_conflicts(Review, reviews, returning=["cafe"])
+                # 리뷰가 추가된 카페의 리뷰 수만 다시 계산
+                touched = {cafe_id for cafe_id, in inserted}
+                if touched:
+                    recount_counters(Cafe, Cafe.all_objects.filter(pk__in=touched))
+            stats["read"] += len(rows)
+            stats["written"] += len(inserted)
+            stats["duplicates"] += len(reviews) - len(inserted)
+            recounted |= touched
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"#### Read {stats['read']} rows, written {stats['written']} rows "
+                f"({stats['read'] / elapsed:.0f} rows/s), duplicates {stats['duplicates']}, "
+                f"orphans {stats['orphans']}"
+            )
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"#### Success to load data to review table "
+            f"(read={stats['read']}, written={stats['written']}, "
+            f"duplicates={stats['duplicates']}, empty={stats['empty']}, "
+            f"orphans={stats['orphans']}, recounted cafes={len(recounted)}, "
+            f"{elapsed:.1f}s, "
+            f"{stats['read'] / max(elapsed, 1e-9):.0f} rows/s)"
+        )
+        if stats["orphan_samples"]:
+            logger.warning(
+                f"#### Unknown cafe ids (sample): {sorted(map(str, stats['orphan_samples']))}"
+            )
+
+    def handle(self, **options):
+        logger.info(f"#### Start to extract data")
+        self.load(self.extract(options["batch_size"]))
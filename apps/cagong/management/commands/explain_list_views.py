@@ -0,0 +1,84 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count
+from apps.cagong.models import Cafe, Review, CafeLike, ReviewLike
+
+PAGE_SIZE = 10
+
+
+class Command(BaseCommand):
+    help = (
+        "목록 API가 실행하는 쿼리의 EXPLAIN ANALYZE 결과를 출력합니다. "
+        "--baseline으로 인덱스 스캔을 끈 결과와 비교할 수 있습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--area-id", type=int, help="기본값: 카페가 가장 많은 지역")
+        parser.add_argument("--cafe-id", type=int, help="기본값: 리뷰가 가장 많은 카페")
+        parser.add_argument("--user-id", type=int, help="기본값: 찜이 가장 많은 사용자")
+        parser.add_argument(
+            "--baseline",
+            action="store_true",
+            help="인덱스 스캔을 끈 상태로 실행 (인덱스가 없을 때의 실행 계획과 비교용)",
+        )
+
+    def most_frequent(self, queryset, field):
+        row = (
+            queryset.values(field)
+            .annotate(count=Count("pk"))
+            .order_by("-count")
+            .first()
+        )
+        return row[field] if row else None
+
+    def get_queries(self, area_id, cafe_id, user_id):
+        cafes = Cafe.objects.filter(is_active=True).order_by("-cagong", "id")
+        return [
+            (
+                "CafeListAPIView (area_id)",
+                cafes.filter(area_id=area_id)[: PAGE_SIZE + 1],
+            ),
+            ("CafeListAPIView", cafes[: PAGE_SIZE + 1]),
+            (
+                "CafeReviewListAPIView",
+                Review.objects.filter(cafe_id=cafe_id, is_active=True).order_by(
+                    "-created_at"
+                )[:PAGE_SIZE],
+            ),
+            (
+                "UserReviewsAPIView",
+                Review.objects.filter(user_id=user_id, is_active=True).order_by(
+                    "-updated_at"
+                )[:PAGE_SIZE],
+            ),
+            (
+                "UserLikedCafesAPIView",
+                CafeLike.objects.filter(user_id=user_id, is_active=True).order_by(
+                    "-updated_at"
+                )[:PAGE_SIZE],
+            ),
+            (
+                "UserLikedReviewsAPIView",
+                ReviewLike.objects.filter(user_id=user_id, is_active=True).order_by(
+                    "-updated_at"
+                )[:PAGE_SIZE],
+            ),
+        ]
+
+    def handle(self, *args, **options):
+        area_id = options["area_id"] or self.most_frequent(Cafe.objects, "area_id")
+        cafe_id = options["cafe_id"] or self.most_frequent(Review.objects, "cafe_id")
+        user_id = options["user_id"] or self.most_frequent(CafeLike.objects, "user_id")
+        self.stdout.write(f"area_id={area_id} cafe_id={cafe_id} user_id={user_id}")
+
+        with transaction.atomic():
+            if options["baseline"]:
+                # SET LOCAL은 트랜잭션이 끝나면 원래대로 돌아간다.
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_indexscan = off")
+                    cursor.execute("SET LOCAL enable_indexonlyscan = off")
+                    cursor.execute("SET LOCAL enable_bitmapscan = off")
+            for label, queryset in self.get_queries(area_id, cafe_id, user_id):
+                self.stdout.write(self.style.SUCCESS(f"#### {label}"))
+                self.stdout.write(queryset.explain(analyze=True, buffers=True))
+                self.stdout.write("")
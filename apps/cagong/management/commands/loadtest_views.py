@@ -0,0 +1,95 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+from requests.adapters import HTTPAdapter
+
+# 비교할 경로 (api/cagong/ 와 api/async/cagong/ 뒤에 붙는 부분)
+DEFAULT_PATHS = [
+    "areas/cities/",
+    "cafes/areas/",
+    "cafes/counts/?ids=1,2,3,4,5",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "실행 중인 서버에 동시 요청을 보내 동기(api/cagong/)와 비동기(api/async/cagong/) "
+        "조회 API의 처리량과 지연 시간을 비교합니다. "
+        "서버는 같은 워커 수로 띄워 두고 실행하세요. "
+        "(예: gunicorn -w 4 config.wsgi / uvicorn --workers 4 config.asgi:application)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sync-url",
+            default="http://localhost:8000",
+            help="동기 API 서버 주소 (WSGI)",
+        )
+        parser.add_argument(
+            "--async-url",
+            default="http://localhost:8001",
+            help="비동기 API 서버 주소 (ASGI)",
+        )
+        parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+        parser.add_argument("--requests", type=int, default=1000, help="경로별 요청 수")
+        parser.add_argument("--timeout", type=float, default=10, help="요청 타임아웃(초)")
+        parser.add_argument("paths", nargs="*", help=f"기본값: {DEFAULT_PATHS}")
+
+    def run(self, url, total, concurrency, timeout):
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_maxsize=concurrency))
+
+        def request(_):
+            start = time.perf_counter()
+            try:
+                ok = session.get(url, timeout=timeout).status_code == 200
+            except requests.RequestException:
+                ok = False
+            return time.perf_counter() - start, ok
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(request, range(total)))
+        elapsed = time.perf_counter() - start
+
+        latencies = sorted(latency for latency, _ in results)
+        quantiles = statistics.quantiles(latencies, n=100)
+        return {
+            "rps": total / elapsed,
+            "p50": quantiles[49] * 1000,
+            "p95": quantiles[94] * 1000,
+            "p99": quantiles[98] * 1000,
+            "errors": sum(not ok for _, ok in results),
+        }
+
+    def handle(self, *args, **options):
+        # 백분위 지연 시간(statistics.quantiles)은 표본이 2개 이상이어야 계산할 수 있음
+        if options["requests"] < 2:
+            raise CommandError("--requests는 2 이상이어야 합니다.")
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency는 1 이상이어야 합니다.")
+        paths = options["paths"] or DEFAULT_PATHS
+        targets = [
+            ("sync", options["sync_url"].rstrip("/") + "/api/cagong/"),
+            ("async", options["async_url"].rstrip("/") + "/api/async/cagong/"),
+        ]
+        self.stdout.write(
+            f"#### concurrency={options['concurrency']} requests={options['requests']}"
+        )
+        for path in paths:
+            self.stdout.write(self.style.SUCCESS(f"#### {path}"))
+            for label, base_url in targets:
+                result = self.run(
+                    base_url + path,
+                    options["requests"],
+                    options["concurrency"],
+                    options["timeout"],
+                )
+                self.stdout.write(
+                    f"{label:>5}: {result['rps']:8.1f} req/s  "
+                    f"p50 {result['p50']:7.1f}ms  p95 {result['p95']:7.1f}ms  "
+                    f"p99 {result['p99']:7.1f}ms  errors {result['errors']}"
+                )
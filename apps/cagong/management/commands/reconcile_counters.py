@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from apps.cagong.models import Cafe
+from common.models import recount_counters
+
+
+class Command(BaseCommand):
+    help = "카페의 찜 수, 리뷰 수 카운터를 실제 활성 행 개수로 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        updated = recount_counters(Cafe)
+        self.stdout.write(self.style.SUCCESS(f"카페 {updated}개의 카운터를 갱신했습니다."))
@@ -0,0 +1,55 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from apps.cagong.models import Review
+from apps.cagong.search import build_search_vector
+from common.db import bulk_update_from_values
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class Command(BaseCommand):
+    help = (
+        "리뷰 검색용 tsvector(search_vector)를 다시 계산합니다. "
+        "마이그레이션 후 기존 리뷰, 토큰화 방식 변경 시 실행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="search_vector가 비어 있는 리뷰만 처리",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=2000, help="한 번에 갱신할 리뷰 수"
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        reviews = Review.all_objects.order_by("id")  # 삭제된 리뷰 포함 (복구 대비)
+        if options["missing"]:
+            reviews = reviews.filter(search_vector__isnull=True)
+
+        # id 범위로 나누어 읽고 쓰기 (OFFSET 없이 마지막 id 이후만 조회)
+        last_id, total = 0, 0
+        while True:
+            batch = list(
+                reviews.filter(id__gt=last_id).values_list("id", "review")[
+                    : options["batch_size"]
+                ]
+            )
+            if not batch:
+                break
+            total += bulk_update_from_values(
+                Review,
+                ["search_vector"],
+                [(pk, build_search_vector(text)) for pk, text in batch],
+            )
+            last_id = batch[-1][0]
+            logger.info(f"#### {total}개 리뷰 색인 (id <= {last_id})")
+
+        logger.info(
+            f"#### 리뷰 색인 완료: {total}개, {time.perf_counter() - start:.1f}초"
+        )
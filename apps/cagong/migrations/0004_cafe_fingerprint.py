@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-18 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cagong', '0003_alter_area_city_code_alter_area_county_code_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cafe',
+            name='fingerprint',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.11 on 2026-10-18 18:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cagong', '0004_cafe_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cafe',
+            name='lat',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='cafe',
+            name='lng',
+            field=models.FloatField(),
+        ),
+        migrations.AddIndex(
+            model_name='cafe',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['lat', 'lng'], name='cafe_active_lat_lng_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-18 18:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cagong', '0005_cafe_float_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cafe',
+            index=models.Index(fields=['area', 'is_active', '-cagong', 'id'], name='cafe_area_active_cagong_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.11 on 2026-10-18 18:13
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def active_count(model):
+    return Coalesce(
+        Subquery(
+            model.objects.filter(cafe=OuterRef("pk"), is_active=True)
+            .order_by()
+            .values("cafe")
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def fill_counters(apps, schema_editor):
+    Cafe = apps.get_model("cagong", "Cafe")
+    Review = apps.get_model("cagong", "Review")
+    CafeLike = apps.get_model("cagong", "CafeLike")
+    Cafe.objects.update(
+        like_count=active_count(CafeLike), review_count=active_count(Review)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cagong', '0006_cafe_area_cagong_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cafe',
+            name='like_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cafe',
+            name='review_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
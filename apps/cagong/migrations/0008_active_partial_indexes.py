@@ -0,0 +1,72 @@
+# Generated by Django 4.2.11 on 2026-10-18 18:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cagong', '0007_cafe_like_count_review_count'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='area',
+            name='cagong_area_city_co_4642d0_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='area',
+            name='cagong_area_county__e1c30a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='area',
+            name='cagong_area_town_co_615eef_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='cafe',
+            name='cafe_area_active_cagong_idx',
+        ),
+        migrations.AlterField(
+            model_name='area',
+            name='city_code',
+            field=models.IntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='area',
+            name='county_code',
+            field=models.IntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='area',
+            name='town_code',
+            field=models.IntegerField(),
+        ),
+        migrations.AddIndex(
+            model_name='area',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['city_code', 'county_code', 'town_code'], name='area_active_codes_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cafe',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['area', '-cagong', 'id'], name='cafe_active_area_cagong_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cafe',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-cagong', 'id'], name='cafe_active_cagong_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cafelike',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', '-updated_at'], name='cafelike_active_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['cafe', '-created_at'], name='review_active_cafe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', '-updated_at'], name='review_active_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewlike',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user', '-updated_at'], name='reviewlike_active_user_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-18 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cagong', '0009_review_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='content_hash',
+            field=models.CharField(max_length=32, null=True, unique=True),
+        ),
+    ]
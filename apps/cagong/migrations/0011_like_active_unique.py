@@ -0,0 +1,58 @@
+# Generated by Django 4.2.11 on 2026-10-18 18:34
+
+from django.db import migrations, models
+from django.db.models import Count, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def deactivate_duplicate_likes(apps, schema_editor):
+    # 같은 (사용자, 대상)의 활성 찜/좋아요가 여러 개면 가장 먼저 만든 것만 남기고 소프트 삭제
+    now = timezone.now()
+    for model_name, target in (("CafeLike", "cafe"), ("ReviewLike", "review")):
+        model = apps.get_model("cagong", model_name)
+        duplicates = (
+            model.objects.filter(is_active=True)
+            .values("user", target)
+            .annotate(keep=Min("pk"), count=Count("pk"))
+            .filter(count__gt=1)
+        )
+        for row in duplicates:
+            model.objects.filter(
+                is_active=True, user=row["user"], **{target: row[target]}
+            ).exclude(pk=row["keep"]).update(is_active=False, deleted_at=now)
+
+    # 카페의 찜 수를 남은 활성 찜 수로 다시 계산
+    Cafe = apps.get_model("cagong", "Cafe")
+    CafeLike = apps.get_model("cagong", "CafeLike")
+    Cafe.objects.update(
+        like_count=Coalesce(
+            Subquery(
+                CafeLike.objects.filter(cafe=OuterRef("pk"), is_active=True)
+                .order_by()
+                .values("cafe")
+                .annotate(count=Count("pk"))
+                .values("count")
+            ),
+            0,
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cagong', '0010_review_content_hash'),
+    ]
+
+    operations = [
+        migrations.RunPython(deactivate_duplicate_likes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='cafelike',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('user', 'cafe'), name='cafelike_active_user_cafe_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='reviewlike',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('user', 'review'), name='reviewlike_active_user_review_uniq'),
+        ),
+    ]
@@ -1,23 +1,29 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from apps.users.models import User
+from apps.cagong.search import build_search_vector
 from common.models import SoftDeleteModel
 
 
 class Area(SoftDeleteModel):
     id = models.IntegerField(primary_key=True)  # 지역 코드를 기본 키로 사용
-    city_code = models.IntegerField(db_index=True)
+    city_code = models.IntegerField()
     city_name = models.CharField(max_length=100)
-    county_code = models.IntegerField(db_index=True)
+    county_code = models.IntegerField()
     county_name = models.CharField(max_length=100)
-    town_code = models.IntegerField(db_index=True)
+    town_code = models.IntegerField()
     town_name = models.CharField(max_length=100)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         indexes = [
-            models.Index(fields=["city_code"]),
-            models.Index(fields=["county_code"]),
-            models.Index(fields=["town_code"]),
+            # 시/도, 시군구, 읍면동 목록 조회용 (앞쪽 컬럼부터 순서대로 사용)
+            models.Index(
+                fields=["city_code", "county_code", "town_code"],
+                condition=models.Q(is_active=True),
+                name="area_active_codes_idx",
+            ),
         ]
 
     def __str__(self):
@@ -34,15 +40,42 @@ class Cafe(SoftDeleteModel):
     )  # 지역과 1:N 관계
     addr = models.CharField(max_length=200)
     cagong = models.IntegerField(default=0)  # 해당 카페가 카공하기 좋은지에 대한 점수
+    like_count = models.IntegerField(default=0)  # 활성 찜 수 (CafeLike가 관리)
+    review_count = models.IntegerField(default=0)  # 활성 리뷰 수 (Review가 관리)
     phone = models.CharField(
         max_length=20,
         null=True,
         blank=True,
     )
-    lat = models.CharField(max_length=50)
-    lng = models.CharField(max_length=50)
+    lat = models.FloatField()
+    lng = models.FloatField()
+    fingerprint = models.CharField(
+        max_length=32, null=True, blank=True
+    )  # 크롤링 원본 데이터의 해시 (변경 감지용)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 지역별 카페 목록의 (-cagong, id) 키셋 페이지네이션용
+            models.Index(
+                fields=["area", "-cagong", "id"],
+                condition=models.Q(is_active=True),
+                name="cafe_active_area_cagong_idx",
+            ),
+            # 지역 조건 없는 카페 목록용
+            models.Index(
+                fields=["-cagong", "id"],
+                condition=models.Q(is_active=True),
+                name="cafe_active_cagong_idx",
+            ),
+            # 주변 카페 검색의 위경도 범위 조회용
+            models.Index(
+                fields=["lat", "lng"],
+                condition=models.Q(is_active=True),
+                name="cafe_active_lat_lng_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -56,11 +89,49 @@ class Review(SoftDeleteModel):
     )  # 카페와 1:N 관계
     review = models.TextField()
     crawling = models.BooleanField(default=False)  # 크롤링 여부
+    content_hash = models.CharField(
+        unique=True, null=True, max_length=32
+    )  # 크롤링 리뷰의 카페, 본문 해시 (중복 적재 방지용)
     created_at = models.DateTimeField(auto_now_add=True)
+    # 리뷰 검색용 tsvector (한글 bigram 토큰, apps/cagong/search.py), 저장 시 갱신
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    counter_fields = {"cafe": "review_count"}
+
+    class Meta:
+        indexes = [
+            # 카페 리뷰 목록 (최신순)
+            models.Index(
+                fields=["cafe", "-created_at"],
+                condition=models.Q(is_active=True),
+                name="review_active_cafe_idx",
+            ),
+            # 사용자 리뷰 목록 (최근 수정순)
+            models.Index(
+                fields=["user", "-updated_at"],
+                condition=models.Q(is_active=True),
+                name="review_active_user_idx",
+            ),
+            # 리뷰 검색
+            GinIndex(
+                fields=["search_vector"],
+                condition=models.Q(is_active=True),
+                name="review_active_search_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.cafe.name}카페의 리뷰"
 
+    def save(self, *args, **kwargs):
+        # 리뷰 내용이 저장될 때만 검색용 tsvector 갱신 (소프트 삭제 등 일부 필드 저장은 제외)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "review" in update_fields:
+            self.search_vector = build_search_vector(self.review)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_vector"}
+        super().save(*args, **kwargs)
+
 
 class CafeLike(SoftDeleteModel):
     cafe = models.ForeignKey(
@@ -70,6 +141,26 @@ class CafeLike(SoftDeleteModel):
         User, on_delete=models.CASCADE, related_name="cafe_likes"
     )  # 사용자와 N:N 관계
 
+    counter_fields = {"cafe": "like_count"}
+
+    class Meta:
+        constraints = [
+            # 사용자, 카페마다 활성 찜은 하나 (CafeLike.objects.activate의 ON CONFLICT 대상)
+            models.UniqueConstraint(
+                fields=["user", "cafe"],
+                condition=models.Q(is_active=True),
+                name="cafelike_active_user_cafe_uniq",
+            ),
+        ]
+        indexes = [
+            # 사용자가 찜한 카페 목록 (최근순)
+            models.Index(
+                fields=["user", "-updated_at"],
+                condition=models.Q(is_active=True),
+                name="cafelike_active_user_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user.email} likes {self.cafe.name}"
 
@@ -82,5 +173,23 @@ class ReviewLike(SoftDeleteModel):
         User, on_delete=models.CASCADE, related_name="review_likes"
     )  # 사용자와 N:N 관계
 
+    class Meta:
+        constraints = [
+            # 사용자, 리뷰마다 활성 좋아요는 하나 (ReviewLike.objects.activate의 ON CONFLICT 대상)
+            models.UniqueConstraint(
+                fields=["user", "review"],
+                condition=models.Q(is_active=True),
+                name="reviewlike_active_user_review_uniq",
+            ),
+        ]
+        indexes = [
+            # 사용자가 좋아요한 리뷰 목록 (최근순)
+            models.Index(
+                fields=["user", "-updated_at"],
+                condition=models.Q(is_active=True),
+                name="reviewlike_active_user_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user.email} likes a review of {self.review.cafe.name}"
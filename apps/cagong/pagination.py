@@ -0,0 +1,137 @@
+import base64
+import binascii
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+# CagongCursorPagination 클래스 정의: (-cagong, id) 키셋 페이지네이션
+# OFFSET 없이 직전 페이지의 마지막 (cagong, id) 이후만 조회하므로 깊은 페이지도 비용이 같다.
+class CagongCursorPagination(BasePagination):
+    page_size = 10
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.count = queryset.count() if self.count_requested(request) else None
+        queryset = queryset.order_by("-cagong", "id")
+        cursor = self.decode_cursor(request)
+
+        size = self.page_size + 1  # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+        if cursor is None:
+            page = list(queryset[:size])
+        else:
+            # 점수가 같은 행(기본값 0이 대부분)과 더 낮은 행을 나누어 조회
+            # OR 조건과 달리 두 쿼리 모두 인덱스 범위 조회로 처리된다.
+            ties, lower = self.after_cursor(queryset, cursor)
+            page = list(ties[:size])
+            if len(page) < size:
+                page += list(lower[: size - len(page)])
+        return self.set_page(page)
+
+    async def apaginate_queryset(self, queryset, request):
+        # ASGI 뷰용: paginate_queryset과 같은 쿼리를 비동기 ORM으로 실행
+        self.request = request
+        self.count = await queryset.acount() if self.count_requested(request) else None
+        queryset = queryset.order_by("-cagong", "id")
+        cursor = self.decode_cursor(request)
+
+        size = self.page_size + 1
+        if cursor is None:
+            page = [cafe async for cafe in queryset[:size]]
+        else:
+            ties, lower = self.after_cursor(queryset, cursor)
+            page = [cafe async for cafe in ties[:size]]
+            if len(page) < size:
+                page += [cafe async for cafe in lower[: size - len(page)]]
+        return self.set_page(page)
+
+    def count_requested(self, request):
+        # request.GET: DRF Request와 ASGI 뷰의 HttpRequest 모두에서 사용 가능
+        return request.GET.get(self.count_query_param) in ("1", "true")
+
+    def after_cursor(self, queryset, cursor):
+        cagong, pk = cursor
+        return (
+            queryset.filter(cagong=cagong, id__gt=pk),
+            queryset.filter(cagong__lt=cagong),
+        )
+
+    def set_page(self, page):
+        self.has_next = len(page) > self.page_size
+        self.page = page[: self.page_size]
+        return self.page
+
+    def decode_cursor(self, request):
+        encoded = request.GET.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cagong, pk = base64.urlsafe_b64decode(encoded.encode()).decode().split(":")
+            return int(cagong), int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, cafe):
+        return base64.urlsafe_b64encode(f"{cafe.cagong}:{cafe.id}".encode()).decode()
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.page[-1])
+        )
+
+    def get_paginated_data(self, data):
+        response = {"next": self.get_next_link()}
+        if self.count is not None:
+            response["count"] = self.count
+        response["results"] = data
+        return response
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+
+# AsyncPageNumberPagination 클래스 정의: ASGI 뷰용 페이지 번호 방식
+# PageNumberPagination과 같은 형식({"count", "next", "previous", "results"})으로 응답
+class AsyncPageNumberPagination:
+    page_size = 10
+    page_query_param = "page"
+    invalid_page_message = "Invalid page."
+
+    async def apaginate_queryset(self, queryset, request):
+        self.request = request
+        try:
+            self.number = int(request.GET.get(self.page_query_param, 1))
+        except ValueError:
+            raise NotFound(self.invalid_page_message)
+        self.count = await queryset.acount()
+        self.num_pages = max(1, -(-self.count // self.page_size))
+        if not 1 <= self.number <= self.num_pages:
+            raise NotFound(self.invalid_page_message)
+        start = (self.number - 1) * self.page_size
+        return [obj async for obj in queryset[start : start + self.page_size]]
+
+    def get_link(self, number):
+        url = self.request.build_absolute_uri()
+        if number == 1:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, number)
+
+    def get_paginated_data(self, data):
+        return {
+            "count": self.count,
+            "next": (
+                self.get_link(self.number + 1)
+                if self.number < self.num_pages
+                else None
+            ),
+            "previous": self.get_link(self.number - 1) if self.number > 1 else None,
+            "results": data,
+        }
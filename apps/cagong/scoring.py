@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from django.db import connections
+
+from apps.cagong.models import Cafe, Review
+
+# 카공 점수 계산
+# 리뷰 본문에서 카공과 관련된 키워드(콘센트, 와이파이, 조용함, 좌석, 영업시간)를 찾아
+# 카페별로 "키워드가 언급된 리뷰 비율"을 구하고, 가중치를 곱해 0~100점으로 환산한다.
+# 리뷰가 적은 카페는 몇 개의 리뷰만으로 점수가 극단적으로 나오지 않도록 리뷰 수에 따라 점수를 줄인다.
+
+# 특징 이름: (정규식, 가중치), 양수 가중치의 합이 100
+FEATURES = {
+    "outlets": (r"콘센트|충전|멀티탭|outlet|plug", 30),
+    "wifi": (r"와이파이|wifi|wi-fi|인터넷", 20),
+    "quiet": (r"조용|한적|잔잔|quiet", 20),
+    "seating": (r"좌석|자리|테이블|넓|의자", 20),
+    "hours": (r"24시|늦게까지|새벽|심야|밤늦", 10),
+    "noisy": (r"시끄|북적|소란|noisy", -20),
+}
+FEATURE_NAMES = list(FEATURES)
+WEIGHTS = np.array([weight for _, weight in FEATURES.values()], dtype=float)
+
+# 리뷰의 이 비율 이상에서 언급되면 해당 특징은 만점 (모든 리뷰가 콘센트를 언급하지는 않음)
+SATURATION = 0.3
+# 리뷰 수 n에 대해 점수에 n / (n + PRIOR_REVIEWS)를 곱함
+PRIOR_REVIEWS = 5
+
+
+def feature_counts(cafe_ids, texts):
+    # 리뷰 청크의 카페별 (리뷰 수, 특징별 언급 리뷰 수) DataFrame, index는 cafe_id
+    text = pd.Series(texts, dtype="string").fillna("").str.lower()
+    frame = pd.DataFrame(
+        {
+            name: text.str.contains(pattern, regex=True).to_numpy(dtype=np.int32)
+            for name, (pattern, _) in FEATURES.items()
+        }
+    )
+    frame["reviews"] = 1
+    frame["cafe_id"] = np.asarray(cafe_ids, dtype=np.int64)
+    return frame.groupby("cafe_id").sum()
+
+
+def compute_scores(counts):
+    # feature_counts 결과(여러 청크를 합친 것)로 카페별 점수 Series 계산
+    reviews = counts["reviews"].to_numpy(dtype=float)
+    ratios = counts[FEATURE_NAMES].to_numpy(dtype=float) / reviews[:, None]
+    raw = np.minimum(ratios / SATURATION, 1.0) @ WEIGHTS
+    scores = raw * reviews / (reviews + PRIOR_REVIEWS)
+    return pd.Series(
+        np.clip(np.rint(scores), 0, 100).astype(int), index=counts.index
+    )
+
+
+def score_cafes(area_ids, cafe_ids=None, chunk_size=5000):
+    # area_ids 지역의 활성 카페(cafe_ids가 있으면 그 중 일부)의 [(cafe_id, 점수), ...]
+    # 프로세스 풀의 작업 단위, 활성 리뷰가 없는 카페는 0점
+    cafes = Cafe.objects.filter(area_id__in=area_ids)
+    reviews = Review.objects.filter(cafe__is_active=True, cafe__area_id__in=area_ids)
+    if cafe_ids is not None:
+        cafes = cafes.filter(id__in=cafe_ids)
+        reviews = reviews.filter(cafe_id__in=cafe_ids)
+
+    try:
+        scores = dict.fromkeys(cafes.values_list("id", flat=True), 0)
+        # 서버 사이드 커서로 chunk_size개씩 읽어 청크마다 벡터 연산으로 집계
+        rows = reviews.values_list("cafe_id", "review").iterator(chunk_size=chunk_size)
+        parts, chunk = [], []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                parts.append(feature_counts(*zip(*chunk)))
+                chunk = []
+        if chunk:
+            parts.append(feature_counts(*zip(*chunk)))
+    finally:
+        # 풀의 작업 프로세스가 연결을 쥔 채로 남지 않도록
+        connections.close_all()
+
+    if parts:
+        counts = pd.concat(parts).groupby(level=0).sum()
+        scores.update(compute_scores(counts).items())
+    return [(cafe_id, int(score)) for cafe_id, score in scores.items()]
@@ -0,0 +1,65 @@
+import re
+import unicodedata
+
+from django.contrib.postgres.search import SearchQuery
+
+# 리뷰 검색용 토큰화
+# PostgreSQL 기본 파서는 한글 어절을 통째로 하나의 단어로 보기 때문에 "카공하기좋은"에서 "카공"을
+# 찾을 수 없다. 한글이 포함된 어절은 2글자 단위(bigram)로 나누고, 영문, 숫자 어절은 그대로 둔다.
+# 문서와 검색어를 같은 방식으로 나누므로 2글자 이상의 부분 문자열은 모두 검색된다.
+# "wifi가"처럼 한글과 영문, 숫자가 붙은 어절은 경계에서 나누어 "wifi", "가"로 본다.
+
+# 한글 연속 구간, 또는 한글이 아닌 \w 문자의 연속 구간
+re_word = re.compile(r"[가-힣ㄱ-ㆎ]+|[^\W가-힣ㄱ-ㆎ]+")
+re_hangul = re.compile(r"[가-힣ㄱ-ㆎ]")
+
+MAX_POSITION = 16383  # tsvector 위치 최댓값
+MAX_TOKEN_BYTES = 2046  # tsvector 어휘소(lexeme) 최대 길이, 넘으면 저장 시 오류
+MAX_QUERY_TOKENS = 32
+
+
+def tokenize(text):
+    # 정규화(NFKC, 소문자) 후 (토큰, 위치) 목록
+    # 어휘소 길이 제한을 넘는 토큰(긴 URL 등)은 to_tsvector와 같이 제외
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    tokens = []
+    for word in re_word.findall(text):
+        if len(word) > 2 and re_hangul.match(word):
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        elif len(word.encode("utf-8")) <= MAX_TOKEN_BYTES:
+            tokens.append(word)
+    return tokens
+
+
+def build_search_vector(text):
+    # to_tsvector('simple', ...)와 같은 형식의 tsvector 문자열: 'token':1,5 'token2':2
+    # 토큰은 \w 문자만 포함하므로 따로 이스케이프하지 않는다.
+    positions = {}
+    for position, token in enumerate(tokenize(text)[:MAX_POSITION], start=1):
+        positions.setdefault(token, []).append(str(position))
+    return " ".join(
+        f"'{token}':{','.join(numbers)}" for token, numbers in positions.items()
+    )
+
+
+# TsQueryLiteral 클래스 정의: tsquery 문자열을 파서를 거치지 않고 그대로 tsquery로 변환
+# to_tsquery(search_type="raw")는 'foo_bar'를 'foo' <-> 'bar'로 다시 나누어
+# 문서에 그대로 저장된 'foo_bar' 토큰과 맞지 않으므로, 문서와 같이 토큰을 그대로 사용한다.
+class TsQueryLiteral(SearchQuery):
+    template = "(%(expressions)s)::tsquery"
+
+    def __init__(self, value):
+        super().__init__(value)
+
+
+def build_search_query(text):
+    # 검색어의 모든 토큰을 포함하는 리뷰를 찾는 tsquery, 토큰이 없으면 None
+    # 한글 1글자 검색어는 그 글자로 시작하는 bigram을 접두어 검색
+    tokens = list(dict.fromkeys(tokenize(text)))[:MAX_QUERY_TOKENS]
+    if not tokens:
+        return None
+    terms = [
+        f"'{token}':*" if len(token) == 1 and re_hangul.match(token) else f"'{token}'"
+        for token in tokens
+    ]
+    return TsQueryLiteral(" & ".join(terms))
@@ -3,6 +3,16 @@ from apps.cagong.models import Area, Cafe, Review, CafeLike, ReviewLike
 from apps.users.serializers import UserSerializer
 
 
+class SparseFieldsMixin:
+    # fields 인자로 받은 필드만 남기는 mixin (?fields=id,name 형태의 sparse fieldset)
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
 class AreaSerializer(serializers.ModelSerializer):
     class Meta:
         model = Area
@@ -52,7 +62,106 @@ class CafeSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Cafe
-        fields = "__all__"
+        exclude = ["fingerprint"]
+        # wordcloud: build_wordclouds 명령어가 계산하는 [["단어", 리뷰 수], ...] JSON 문자열
+        # is_active, deleted_at: 삭제/복구는 soft_delete/restore로만 (하위 행, 카운터 함께 처리)
+        read_only_fields = [
+            "like_count",
+            "review_count",
+            "wordcloud",
+            "is_active",
+            "deleted_at",
+        ]
+
+
+class MyLikeSerializerMixin(serializers.Serializer):
+    # 로그인 사용자의 찜/좋아요 여부 (views.annotate_my_like로 my_like_id를 주석한 객체에 사용)
+    is_liked = serializers.SerializerMethodField()
+    my_like_id = serializers.IntegerField(
+        read_only=True, allow_null=True, help_text="찜/좋아요 id (해제 시 사용)"
+    )
+
+    def get_is_liked(self, obj) -> bool:
+        return obj.my_like_id is not None
+
+
+class CafeWithLikeSerializer(MyLikeSerializerMixin, CafeSerializer):
+    pass
+
+
+class CafeListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    # 목록용 요약 표현: 리뷰 id 목록 대신 개수만 포함
+    area = AreaSerializer(read_only=True)
+
+    class Meta:
+        model = Cafe
+        fields = [
+            "id",
+            "name",
+            "area",
+            "addr",
+            "phone",
+            "lat",
+            "lng",
+            "cagong",
+            "review_count",
+            "like_count",
+        ]
+
+
+class CafeListWithLikeSerializer(MyLikeSerializerMixin, CafeListSerializer):
+    class Meta(CafeListSerializer.Meta):
+        fields = CafeListSerializer.Meta.fields + ["is_liked", "my_like_id"]
+
+
+class CafeCountsQuerySerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), min_length=1, max_length=300
+    )
+
+
+class CafeCountsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Cafe
+        fields = ["id", "like_count", "review_count"]
+
+
+class CafeAutocompleteQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=50, help_text="카페 이름 또는 주소의 앞부분")
+    limit = serializers.IntegerField(default=10, min_value=1, max_value=20)
+
+
+class CafeAutocompleteSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Cafe
+        fields = ["id", "name", "addr", "cagong", "area_id"]
+
+
+class NearbyCafeQuerySerializer(serializers.Serializer):
+    lat = serializers.FloatField(min_value=-90, max_value=90)
+    lng = serializers.FloatField(min_value=-180, max_value=180)
+    radius = serializers.IntegerField(
+        default=1000, min_value=1, max_value=20000, help_text="검색 반경(m)"
+    )
+    limit = serializers.IntegerField(default=20, min_value=1, max_value=100)
+
+
+class NearbyCafeSerializer(serializers.ModelSerializer):
+    distance = serializers.FloatField(read_only=True, help_text="거리(m)")
+
+    class Meta:
+        model = Cafe
+        fields = [
+            "id",
+            "name",
+            "area",
+            "addr",
+            "phone",
+            "lat",
+            "lng",
+            "cagong",
+            "distance",
+        ]
 
 
 class ReviewSerializer(serializers.ModelSerializer):
@@ -61,7 +170,24 @@ class ReviewSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Review
-        fields = "__all__"
+        exclude = ["search_vector", "content_hash"]
+        # is_active, deleted_at: 삭제/복구는 soft_delete/restore로만 (카페 리뷰 수, 좋아요 함께 처리)
+        read_only_fields = ["crawling", "is_active", "deleted_at"]
+
+
+class ReviewWithLikeSerializer(MyLikeSerializerMixin, ReviewSerializer):
+    pass
+
+
+class ReviewSearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=100, help_text="검색어")
+    area_id = serializers.IntegerField(required=False, help_text="지역 id")
+    limit = serializers.IntegerField(default=20, min_value=1, max_value=50)
+    offset = serializers.IntegerField(default=0, min_value=0, max_value=1000)
+
+
+class ReviewSearchSerializer(ReviewSerializer):
+    rank = serializers.FloatField(read_only=True, help_text="검색 관련도")
 
 
 class CafeLikeSerializer(serializers.ModelSerializer):
@@ -73,6 +199,19 @@ class CafeLikeSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class CafeLikeCreateSerializer(serializers.Serializer):
+    cafe = serializers.PrimaryKeyRelatedField(queryset=Cafe.objects.all())
+
+
+class ReviewLikeCreateSerializer(serializers.Serializer):
+    review = serializers.PrimaryKeyRelatedField(queryset=Review.objects.all())
+
+
+class LikeStateSerializer(serializers.Serializer):
+    is_liked = serializers.BooleanField()
+    my_like_id = serializers.IntegerField(allow_null=True, help_text="찜/좋아요 id")
+
+
 class ReviewLikeSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
     review = serializers.StringRelatedField()
@@ -1,3 +1,79 @@
-from django.test import TestCase
+import time
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+
+from apps.cagong.cafe_index import CafeIndex, cafe_index_version
+from apps.cagong.models import Review
+from apps.cagong.search import build_search_query, build_search_vector, tokenize
+from common.cache import VersionedSnapshot
+
+
+class SearchTest(SimpleTestCase):
+    def compile(self, query):
+        compiler = Review.objects.all().query.get_compiler(connection=connection)
+        return query.as_sql(compiler, connection)
+
+    def test_tokenize_splits_hangul_boundaries(self):
+        self.assertEqual(tokenize("wifi가"), ["wifi", "가"])
+        self.assertEqual(tokenize("카공하기"), ["카공", "공하", "하기"])
+        self.assertEqual(tokenize("foo_bar-baz"), ["foo_bar", "baz"])
+
+    def test_long_tokens_are_dropped(self):
+        self.assertEqual(build_search_vector("x" * 3000 + " 좋아"), "'좋아':1")
+
+    def test_query_uses_document_tokens_without_parsing(self):
+        # 문서에 'foo_bar' 한 토큰으로 저장되므로 검색어도 to_tsquery로 다시 나누지 않음
+        self.assertIn("'foo_bar':1", build_search_vector("foo_bar 좋아요"))
+        sql, params = self.compile(build_search_query("foo_bar가"))
+        self.assertEqual(sql, "(%s)::tsquery")
+        self.assertEqual(params, ["'foo_bar' & '가':*"])
+        self.assertNotIn("to_tsquery", sql)
+
+    def test_query_without_tokens(self):
+        self.assertIsNone(build_search_query("!!"))
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class CafeIndexSnapshotTest(SimpleTestCase):
+    def setUp(self):
+        self.rows = [(1, "스타벅스 광화문점", "서울특별시 종로구", 10, 1)]
+        self.snapshot = VersionedSnapshot(
+            cafe_index_version, lambda: CafeIndex(list(self.rows)), background=True
+        )
+        self.addCleanup(cache.delete, cafe_index_version.key)
+
+    def search(self, query):
+        # 백그라운드 빌드가 끝날 때까지 기다린 뒤 검색
+        self.snapshot.get()
+        for _ in range(100):
+            if not self.snapshot._building:
+                break
+            time.sleep(0.01)
+        return self.snapshot.get().search(query)
+
+    def test_search_and_prefix_ranks(self):
+        rows = [(pk, f"카페{pk}", "서울특별시 종로구", 100 - pk, 1) for pk in range(30)]
+        index = CafeIndex(rows)
+        self.assertIn(b'"id":0', index.search("서울특별시종로", limit=3))
+        self.assertEqual(index.search("서울특별시종로", limit=3).count(b'"id"'), 3)
+        self.assertEqual(index.search("없는카페"), b"[]")
+
+    def test_rebuild_after_stamp_is_evicted(self):
+        cafe_index_version.bump()
+        self.assertIn(b'"id":1', self.search("스타벅스"))
+        self.assertEqual(self.search("투썸"), b"[]")
+
+        # 버전 키가 캐시에서 지워진 뒤 카페가 추가되고 bump 되어도 새 인덱스로 교체
+        cache.delete(cafe_index_version.key)
+        self.rows.append((2, "투썸플레이스 종로점", "서울특별시 종로구", 5, 1))
+        cafe_index_version.bump()
+        self.assertIn(b'"id":2', self.search("투썸"))
+
+        # bump 없이 키만 지워진 경우에도 다시 빌드
+        cache.delete(cafe_index_version.key)
+        self.rows.pop()
+        self.assertEqual(self.search("투썸"), b"[]")
@@ -20,6 +20,16 @@ urlpatterns = [
     # Cafe 관련 API
     # /cafes/areas/?area_id=11&page=1 형태로 호출할 수 있습니다.
     path("cafes/areas/", CafeListAPIView.as_view(), name="cafe-list"),
+    # /cafes/nearby/?lat=37.5&lng=127.0&radius=1000&limit=20 형태로 호출할 수 있습니다.
+    path("cafes/nearby/", CafeNearbyAPIView.as_view(), name="cafe-nearby"),
+    # /cafes/counts/?ids=1,2,3 형태로 호출할 수 있습니다. (POST {"ids": [...]}도 가능)
+    path("cafes/counts/", CafeCountsAPIView.as_view(), name="cafe-counts"),
+    # /cafes/autocomplete/?q=스타벅&limit=10 형태로 호출할 수 있습니다.
+    path(
+        "cafes/autocomplete/",
+        CafeAutocompleteAPIView.as_view(),
+        name="cafe-autocomplete",
+    ),
     path("cafes/<int:pk>/", CafeDetailAPIView.as_view(), name="cafe-detail"),
     path("cafes/", CafeCreateAPIView.as_view(), name="cafe-create"),
     path("cafes/<int:pk>/", CafeUpdateAPIView.as_view(), name="cafe-update"),
@@ -51,6 +61,8 @@ urlpatterns = [
         UserLikedReviewsAPIView.as_view(),
         name="user-liked-reviews",
     ),
+    # /reviews/search/?q=콘센트&area_id=11 형태로 호출할 수 있습니다.
+    path("reviews/search/", ReviewSearchAPIView.as_view(), name="review-search"),
     path("reviews/", ReviewCreateAPIView.as_view(), name="review-create"),
     path("reviews/<int:pk>/", ReviewUpdateAPIView.as_view(), name="review-update"),
     path("reviews/<int:pk>/", ReviewDeleteAPIView.as_view(), name="review-delete"),
@@ -61,6 +73,8 @@ urlpatterns = [
         CafeLikeDeleteAPIView.as_view(),
         name="cafe-like-delete",
     ),
+    # PUT: 찜하기, DELETE: 찜 해제 (여러 번 요청해도 결과가 같음)
+    path("cafes/<int:pk>/like/", CafeLikeToggleAPIView.as_view(), name="cafe-like"),
     # ReviewLike 관련 API
     path(
         "reviews/likes/", ReviewLikeCreateAPIView.as_view(), name="review-like-create"
@@ -70,4 +84,5 @@ urlpatterns = [
         ReviewLikeDeleteAPIView.as_view(),
         name="review-like-delete",
     ),
+    path("reviews/<int:pk>/like/", ReviewLikeToggleAPIView.as_view(), name="review-like"),
 ]
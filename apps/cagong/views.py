@@ -1,3 +1,9 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchRank
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery
+from django.http import HttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -7,6 +13,81 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from apps.cagong.models import Area, Cafe, Review, CafeLike, ReviewLike
 from apps.cagong.serializers import *
+from apps.cagong.area_index import area_index_version, get_area_index
+from apps.cagong.cafe_index import cafe_index_version, get_cafe_index
+from apps.cagong.pagination import CagongCursorPagination
+from apps.cagong.geo import bounding_box, haversine_distance
+from apps.cagong.search import build_search_query
+
+
+def json_bytes_response(body):
+    # 미리 직렬화된 JSON을 그대로 응답
+    return HttpResponse(body, content_type="application/json")
+
+
+def get_requested_fields(request):
+    # ?fields=id,name 형태의 sparse fieldset, 지정하지 않으면 None
+    # (DRF Request와 Django HttpRequest 모두 request.GET으로 쿼리 문자열을 읽음)
+    fields = request.GET.get("fields")
+    if not fields:
+        return None
+    return [name.strip() for name in fields.split(",") if name.strip()]
+
+
+def annotate_my_like(queryset, user, like_model, field_name):
+    # 사용자의 활성 찜/좋아요 id를 my_like_id로 주석 (없으면 None)
+    # 행마다 따로 조회하지 않고 목록 쿼리 안의 상관 서브쿼리 하나로 처리
+    likes = (
+        like_model.objects.filter(user=user, **{field_name: OuterRef("pk")})
+        .order_by("-id")
+        .values("id")[:1]
+    )
+    return queryset.annotate(my_like_id=Subquery(likes))
+
+
+def cafe_counts_keys(ids):
+    return {pk: f"cagong:cafe_counts:{pk}" for pk in ids}
+
+
+def cafe_counts_queryset(ids):
+    return Cafe.objects.filter(pk__in=ids).values("id", "like_count", "review_count")
+
+
+def get_cafe_counts(ids):
+    # 여러 카페의 찜 수, 리뷰 수를 한 번의 쿼리로 조회 (짧은 TTL의 카페별 캐시 사용)
+    timeout = settings.CAFE_COUNTS_CACHE_TIMEOUT
+    keys = cafe_counts_keys(ids)
+    cached = cache.get_many(keys.values()) if timeout else {}
+    counts = {pk: cached[key] for pk, key in keys.items() if key in cached}
+
+    missing = [pk for pk in ids if pk not in counts]
+    if missing:
+        fetched = {row["id"]: row for row in cafe_counts_queryset(missing)}
+        counts.update(fetched)
+        if timeout:
+            cache.set_many(
+                {keys[pk]: row for pk, row in fetched.items()}, timeout=timeout
+            )
+    # 요청 순서 유지, 존재하지 않는 카페는 제외
+    return [counts[pk] for pk in ids if pk in counts]
+
+
+async def aget_cafe_counts(ids):
+    # get_cafe_counts의 비동기 버전 (같은 캐시 키와 쿼리 사용, api/async/cagong/cafes/counts/)
+    timeout = settings.CAFE_COUNTS_CACHE_TIMEOUT
+    keys = cafe_counts_keys(ids)
+    cached = await cache.aget_many(keys.values()) if timeout else {}
+    counts = {pk: cached[key] for pk, key in keys.items() if key in cached}
+
+    missing = [pk for pk in ids if pk not in counts]
+    if missing:
+        fetched = {row["id"]: row async for row in cafe_counts_queryset(missing)}
+        counts.update(fetched)
+        if timeout:
+            await cache.aset_many(
+                {keys[pk]: row for pk, row in fetched.items()}, timeout=timeout
+            )
+    return [counts[pk] for pk in ids if pk in counts]
 
 
 # Area 관련 API
@@ -17,14 +98,7 @@ class CityListAPIView(APIView):
         responses={200: openapi.Response("시/도 목록", CityListSerializer(many=True))},
     )
     def get(self, request):
-        areas = (
-            Area.objects.filter(is_active=True)
-            .values("city_name", "city_code")
-            .distinct()
-            .order_by("city_code")
-        )
-        serializer = CityListSerializer(areas, many=True)
-        return Response(serializer.data)
+        return json_bytes_response(get_area_index().city_list())
 
 
 class CountyListAPIView(APIView):
@@ -36,14 +110,7 @@ class CountyListAPIView(APIView):
         },
     )
     def get(self, request, city_code):
-        counties = (
-            Area.objects.filter(city_code=city_code, is_active=True)
-            .values("city_code", "county_code", "county_name")
-            .distinct()
-            .order_by("county_code")
-        )
-        serializer = CountyListSerializer(counties, many=True)
-        return Response(serializer.data)
+        return json_bytes_response(get_area_index().county_list(city_code))
 
 
 class TownListAPIView(APIView):
@@ -53,15 +120,7 @@ class TownListAPIView(APIView):
         responses={200: openapi.Response("읍면동 목록", TownListSerializer(many=True))},
     )
     def get(self, request, city_code, county_code):
-        towns = (
-            Area.objects.filter(
-                city_code=city_code, county_code=county_code, is_active=True
-            )
-            .values("id", "town_code", "town_name")
-            .order_by("town_code")
-        )
-        serializer = TownListSerializer(towns, many=True)
-        return Response(serializer.data)
+        return json_bytes_response(get_area_index().town_list(city_code, county_code))
 
 
 class AreaCreateAPIView(APIView):
@@ -77,6 +136,7 @@ class AreaCreateAPIView(APIView):
         serializer = AreaSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save()
+            transaction.on_commit(area_index_version.bump)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -95,6 +155,7 @@ class AreaUpdateAPIView(APIView):
         serializer = AreaSerializer(area, data=request.data)
         if serializer.is_valid():
             serializer.save()
+            transaction.on_commit(area_index_version.bump)
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -110,6 +171,8 @@ class AreaDeleteAPIView(APIView):
     def delete(self, request, pk):
         area = Area.objects.get(pk=pk)
         area.delete()
+        transaction.on_commit(area_index_version.bump)
+        transaction.on_commit(cafe_index_version.bump)  # 지역의 카페도 함께 삭제됨
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -118,35 +181,144 @@ class CafeListAPIView(APIView):
     @swagger_auto_schema(
         operation_summary="카페 목록 조회",
         operation_description="모든 카페 목록을 조회합니다.",
-        responses={200: openapi.Response("카페 목록", CafeSerializer(many=True))},
+        manual_parameters=[
+            openapi.Parameter("area_id", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter(
+                "cursor",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="지정하면 커서(키셋) 방식으로 조회, 첫 페이지는 빈 값(?cursor=), "
+                "다음 페이지는 이전 응답의 next에 포함된 커서",
+            ),
+            openapi.Parameter(
+                "count",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_BOOLEAN,
+                description="(커서 방식) true이면 전체 개수(count)를 함께 반환",
+            ),
+            openapi.Parameter(
+                "page",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_INTEGER,
+                description="페이지 번호 (기본 방식)",
+            ),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="응답에 포함할 필드 (예: id,name,cagong)",
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                "카페 목록 (is_liked, my_like_id는 로그인한 경우에만 포함)",
+                CafeListWithLikeSerializer(many=True),
+            )
+        },
     )
     def get(self, request):
         area_id = request.query_params.get("area_id", None)
+        fields = get_requested_fields(request)
 
+        cafes = Cafe.objects.select_related("area").filter(is_active=True)
         if area_id:
-            cafes = Cafe.objects.filter(area__id=area_id, is_active=True).order_by(
-                "-cagong", "id"
-            )
-        else:
-            cafes = Cafe.objects.filter(is_active=True).order_by("-cagong", "id")
+            cafes = cafes.filter(area__id=area_id)
+        cafes = cafes.order_by("-cagong", "id")
 
-        paginator = PageNumberPagination()
-        paginator.page_size = 10  # 페이지당 항목 수를 10으로 설정
+        serializer_class = CafeListSerializer
+        if request.user.is_authenticated:
+            cafes = annotate_my_like(cafes, request.user, CafeLike, "cafe")
+            serializer_class = CafeListWithLikeSerializer
+
+        if "cursor" in request.query_params:
+            # cursor를 보낸 클라이언트만 키셋 페이지네이션 사용 ({next, results})
+            paginator = CagongCursorPagination()
+        else:
+            # 기본: 기존 클라이언트와 같은 페이지 번호 방식 ({count, next, previous, results})
+            paginator = PageNumberPagination()
+            paginator.page_size = 10  # 페이지당 항목 수를 10으로 설정
         result_page = paginator.paginate_queryset(cafes, request)
 
-        serializer = CafeSerializer(result_page, many=True)
+        serializer = serializer_class(result_page, many=True, fields=fields)
         return paginator.get_paginated_response(serializer.data)
 
 
+class CafeNearbyAPIView(APIView):
+    @swagger_auto_schema(
+        operation_summary="주변 카페 조회",
+        operation_description="좌표 기준 반경 안의 카페를 가까운 순(같으면 카공 점수 순)으로 조회합니다.",
+        query_serializer=NearbyCafeQuerySerializer,
+        responses={
+            200: openapi.Response("주변 카페 목록", NearbyCafeSerializer(many=True)),
+            400: "Bad Request",
+        },
+    )
+    def get(self, request):
+        query = NearbyCafeQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        lat, lng, radius, limit = (
+            query.validated_data[key] for key in ("lat", "lng", "radius", "limit")
+        )
+
+        # 위경도 범위로 인덱스에서 후보를 좁힌 뒤 실제 거리로 필터링, 정렬
+        lat_range, lng_range = bounding_box(lat, lng, radius)
+        cafes = (
+            Cafe.objects.filter(
+                is_active=True, lat__range=lat_range, lng__range=lng_range
+            )
+            .annotate(distance=haversine_distance(lat, lng))
+            .filter(distance__lte=radius)
+            .order_by("distance", "-cagong", "id")[:limit]
+        )
+        serializer = NearbyCafeSerializer(cafes, many=True)
+        return Response(serializer.data)
+
+
+class CafeAutocompleteAPIView(APIView):
+    @swagger_auto_schema(
+        operation_summary="카페 자동완성",
+        operation_description="이름 또는 주소(어절 단위)가 검색어로 시작하는 카페를 카공 점수 순으로 조회합니다.",
+        query_serializer=CafeAutocompleteQuerySerializer,
+        responses={
+            200: openapi.Response(
+                "카페 목록", CafeAutocompleteSerializer(many=True)
+            ),
+            400: "Bad Request",
+        },
+    )
+    def get(self, request):
+        query = CafeAutocompleteQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        # 프로세스 메모리의 접두어 인덱스에서 조회 (카페 데이터가 바뀔 때만 다시 생성)
+        return json_bytes_response(
+            get_cafe_index().search(
+                query.validated_data["q"], query.validated_data["limit"]
+            )
+        )
+
+
 class CafeDetailAPIView(APIView):
     @swagger_auto_schema(
         operation_summary="카페 상세 조회",
         operation_description="특정 카페의 상세 정보를 조회합니다.",
-        responses={200: CafeSerializer, 404: "Not Found"},
+        responses={
+            200: openapi.Response(
+                "카페 (is_liked, my_like_id는 로그인한 경우에만 포함)",
+                CafeWithLikeSerializer,
+            ),
+            404: "Not Found",
+        },
     )
     def get(self, request, pk):
-        cafe = Cafe.objects.get(pk=pk)
-        serializer = CafeSerializer(cafe)
+        cafes = Cafe.objects.select_related("area").prefetch_related("reviews")
+        serializer_class = CafeSerializer
+        if request.user.is_authenticated:
+            cafes = annotate_my_like(cafes, request.user, CafeLike, "cafe")
+            serializer_class = CafeWithLikeSerializer
+        cafe = cafes.get(pk=pk)
+        serializer = serializer_class(cafe)
         return Response(serializer.data)
 
 
@@ -163,6 +335,7 @@ class CafeCreateAPIView(APIView):
         serializer = CafeSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save()
+            transaction.on_commit(cafe_index_version.bump)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -181,6 +354,7 @@ class CafeUpdateAPIView(APIView):
         serializer = CafeSerializer(cafe, data=request.data, partial=True)
         if serializer.is_valid():
             serializer.save()
+            transaction.on_commit(cafe_index_version.bump)
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -196,9 +370,50 @@ class CafeDeleteAPIView(APIView):
     def delete(self, request, pk):
         cafe = Cafe.objects.get(pk=pk)
         cafe.delete()
+        transaction.on_commit(cafe_index_version.bump)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class CafeCountsAPIView(APIView):
+    counts_response = openapi.Response(
+        "카페별 찜 수, 리뷰 수", CafeCountsSerializer(many=True)
+    )
+
+    @swagger_auto_schema(
+        operation_summary="여러 카페의 찜 수, 리뷰 수 조회",
+        operation_description="최대 300개 카페의 찜 수와 리뷰 수를 한 번에 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                "ids",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                description="쉼표로 구분한 카페 id 목록 (예: 1,2,3)",
+                required=True,
+            ),
+        ],
+        responses={200: counts_response, 400: "Bad Request"},
+    )
+    def get(self, request):
+        ids = [pk for pk in request.query_params.get("ids", "").split(",") if pk]
+        return self.get_counts_response({"ids": ids})
+
+    @swagger_auto_schema(
+        operation_summary="여러 카페의 찜 수, 리뷰 수 조회 (POST)",
+        operation_description="요청 본문의 ids 목록(최대 300개)에 대한 찜 수와 리뷰 수를 조회합니다.",
+        request_body=CafeCountsQuerySerializer,
+        responses={200: counts_response, 400: "Bad Request"},
+    )
+    def post(self, request):
+        return self.get_counts_response(request.data)
+
+    def get_counts_response(self, data):
+        serializer = CafeCountsQuerySerializer(data=data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        ids = list(dict.fromkeys(serializer.validated_data["ids"]))  # 중복 제거
+        return Response(get_cafe_counts(ids))
+
+
 class CafeLikeCountAPIView(APIView):
     @swagger_auto_schema(
         operation_summary="카페 좋아요 수 조회",
@@ -216,8 +431,7 @@ class CafeLikeCountAPIView(APIView):
     )
     def get(self, request, pk):
         try:
-            cafe = Cafe.objects.get(pk=pk)
-            count = cafe.likes.count()
+            count = Cafe.objects.values_list("like_count", flat=True).get(pk=pk)
             return Response({"count": count})
         except Cafe.DoesNotExist:
             return Response({"error": "Cafe not found"}, status=404)
@@ -240,8 +454,7 @@ class CafeReviewCountAPIView(APIView):
     )
     def get(self, request, pk):
         try:
-            cafe = Cafe.objects.get(pk=pk)
-            count = cafe.reviews.filter(is_active=True).count()
+            count = Cafe.objects.values_list("review_count", flat=True).get(pk=pk)
             return Response({"count": count})
         except Cafe.DoesNotExist:
             return Response({"error": "Cafe not found"}, status=404)
@@ -252,7 +465,10 @@ class CafeReviewListAPIView(APIView):
         operation_summary="카페 리뷰 목록 조회",
         operation_description="특정 카페의 모든 리뷰 목록을 조회합니다.",
         responses={
-            200: openapi.Response("리뷰 목록", ReviewSerializer(many=True)),
+            200: openapi.Response(
+                "리뷰 목록 (is_liked, my_like_id는 로그인한 경우에만 포함)",
+                ReviewWithLikeSerializer(many=True),
+            ),
             404: "Not Found",
         },
     )
@@ -262,13 +478,21 @@ class CafeReviewListAPIView(APIView):
         except Cafe.DoesNotExist:
             return Response({"error": "Cafe not found"}, status=404)
 
-        reviews = cafe.reviews.filter(is_active=True).order_by("-created_at")
+        reviews = (
+            cafe.reviews.filter(is_active=True)
+            .select_related("user", "cafe")
+            .order_by("-created_at")
+        )
+        serializer_class = ReviewSerializer
+        if request.user.is_authenticated:
+            reviews = annotate_my_like(reviews, request.user, ReviewLike, "review")
+            serializer_class = ReviewWithLikeSerializer
 
         paginator = PageNumberPagination()
         paginator.page_size = 10  # 페이지당 항목 수를 설정합니다.
         result_page = paginator.paginate_queryset(reviews, request)
 
-        serializer = ReviewSerializer(result_page, many=True)
+        serializer = serializer_class(result_page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
 
@@ -334,6 +558,41 @@ class UserLikedReviewsAPIView(APIView):
         return paginator.get_paginated_response(serializer.data)
 
 
+class ReviewSearchAPIView(APIView):
+    @swagger_auto_schema(
+        operation_summary="리뷰 검색",
+        operation_description="리뷰 내용에서 검색어를 찾아 관련도 순으로 조회합니다. area_id로 지역을 제한할 수 있습니다.",
+        query_serializer=ReviewSearchQuerySerializer,
+        responses={
+            200: openapi.Response("리뷰 검색 결과", ReviewSearchSerializer(many=True)),
+            400: "Bad Request",
+        },
+    )
+    def get(self, request):
+        query = ReviewSearchQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = query.validated_data
+        search_query = build_search_query(data["q"])
+        if search_query is None:
+            return Response([])
+
+        # 활성 리뷰의 GIN 인덱스(review_active_search_idx)로 후보를 찾은 뒤 순위 계산
+        reviews = Review.objects.select_related("user", "cafe").filter(
+            is_active=True, search_vector=search_query
+        )
+        if "area_id" in data:
+            reviews = reviews.filter(cafe__area_id=data["area_id"])
+        reviews = reviews.annotate(
+            rank=SearchRank(F("search_vector"), search_query)
+        ).order_by("-rank", "-id")
+        offset = data["offset"]
+        serializer = ReviewSearchSerializer(
+            reviews[offset : offset + data["limit"]], many=True
+        )
+        return Response(serializer.data)
+
+
 class ReviewCreateAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -401,16 +660,50 @@ class CafeLikeCreateAPIView(APIView):
 
     @swagger_auto_schema(
         operation_summary="카페 찜 생성",
-        operation_description="특정 카페를 찜합니다.",
-        request_body=CafeLikeSerializer,
-        responses={201: CafeLikeSerializer, 400: "Bad Request"},
+        operation_description="특정 카페를 찜합니다. 이미 찜한 카페면 기존 찜을 반환합니다.",
+        request_body=CafeLikeCreateSerializer,
+        responses={
+            201: CafeLikeSerializer,
+            200: openapi.Response("이미 찜한 카페", CafeLikeSerializer),
+            400: "Bad Request",
+        },
     )
     def post(self, request):
-        serializer = CafeLikeSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        serializer = CafeLikeCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        like_id, created = CafeLike.objects.activate(
+            user_id=request.user.pk, cafe_id=serializer.validated_data["cafe"].pk
+        )
+        like = CafeLike.objects.select_related("user", "cafe").get(pk=like_id)
+        return Response(
+            CafeLikeSerializer(like).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class CafeLikeToggleAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="카페 찜하기",
+        operation_description="카페를 찜합니다. 여러 번 요청해도 찜은 하나만 유지됩니다.",
+        responses={200: LikeStateSerializer, 404: "Not Found"},
+    )
+    def put(self, request, pk):
+        if not Cafe.objects.filter(pk=pk).exists():
+            return Response({"error": "Cafe not found"}, status=404)
+        like_id, _ = CafeLike.objects.activate(user_id=request.user.pk, cafe_id=pk)
+        return Response({"is_liked": True, "my_like_id": like_id})
+
+    @swagger_auto_schema(
+        operation_summary="카페 찜 해제",
+        operation_description="카페 찜을 해제합니다. 찜하지 않은 카페여도 성공합니다.",
+        responses={204: "No Content"},
+    )
+    def delete(self, request, pk):
+        CafeLike.objects.filter(user=request.user, cafe_id=pk).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class CafeLikeDeleteAPIView(APIView):
@@ -422,7 +715,10 @@ class CafeLikeDeleteAPIView(APIView):
         responses={204: "No Content", 404: "Not Found"},
     )
     def delete(self, request, pk):
-        like = CafeLike.objects.get(pk=pk)
+        # 본인의 찜/좋아요만 삭제, 이미 삭제된 경우에도 204 (카운터는 한 번만 감소)
+        like = CafeLike.all_objects.filter(pk=pk, user=request.user).first()
+        if like is None:
+            return Response({"error": "Like not found"}, status=404)
         like.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -433,16 +729,50 @@ class ReviewLikeCreateAPIView(APIView):
 
     @swagger_auto_schema(
         operation_summary="리뷰 좋아요 생성",
-        operation_description="특정 리뷰를 좋아요합니다.",
-        request_body=ReviewLikeSerializer,
-        responses={201: ReviewLikeSerializer, 400: "Bad Request"},
+        operation_description="특정 리뷰를 좋아요합니다. 이미 좋아요한 리뷰면 기존 좋아요를 반환합니다.",
+        request_body=ReviewLikeCreateSerializer,
+        responses={
+            201: ReviewLikeSerializer,
+            200: openapi.Response("이미 좋아요한 리뷰", ReviewLikeSerializer),
+            400: "Bad Request",
+        },
     )
     def post(self, request):
-        serializer = ReviewLikeSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        serializer = ReviewLikeCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        like_id, created = ReviewLike.objects.activate(
+            user_id=request.user.pk, review_id=serializer.validated_data["review"].pk
+        )
+        like = ReviewLike.objects.select_related("user", "review__cafe").get(pk=like_id)
+        return Response(
+            ReviewLikeSerializer(like).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class ReviewLikeToggleAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="리뷰 좋아요",
+        operation_description="리뷰를 좋아요합니다. 여러 번 요청해도 좋아요는 하나만 유지됩니다.",
+        responses={200: LikeStateSerializer, 404: "Not Found"},
+    )
+    def put(self, request, pk):
+        if not Review.objects.filter(pk=pk).exists():
+            return Response({"error": "Review not found"}, status=404)
+        like_id, _ = ReviewLike.objects.activate(user_id=request.user.pk, review_id=pk)
+        return Response({"is_liked": True, "my_like_id": like_id})
+
+    @swagger_auto_schema(
+        operation_summary="리뷰 좋아요 해제",
+        operation_description="리뷰 좋아요를 해제합니다. 좋아요하지 않은 리뷰여도 성공합니다.",
+        responses={204: "No Content"},
+    )
+    def delete(self, request, pk):
+        ReviewLike.objects.filter(user=request.user, review_id=pk).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class ReviewLikeDeleteAPIView(APIView):
@@ -454,6 +784,9 @@ class ReviewLikeDeleteAPIView(APIView):
         responses={204: "No Content", 404: "Not Found"},
     )
     def delete(self, request, pk):
-        like = ReviewLike.objects.get(pk=pk)
+        # 본인의 찜/좋아요만 삭제, 이미 삭제된 경우에도 204 (카운터는 한 번만 감소)
+        like = ReviewLike.all_objects.filter(pk=pk, user=request.user).first()
+        if like is None:
+            return Response({"error": "Like not found"}, status=404)
         like.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,89 @@
+import json
+import re
+import unicodedata
+from collections import Counter
+
+from django.db import connections
+
+from apps.cagong.models import Cafe, Review
+
+# 카페 워드클라우드 계산
+# 리뷰를 어절 단위로 나누고 끝의 조사/어미를 떼어 낸 뒤, 카페별로 "그 단어가 나온 리뷰 수"를 센다.
+# (한 리뷰에서 같은 단어를 반복해도 한 번만 센다.) 상위 TOP_K개를 [["단어", 리뷰 수], ...] 형태의
+# 공백 없는 JSON으로 Cafe.wordcloud에 저장한다.
+
+TOP_K = 50
+MIN_LENGTH = 2
+MAX_LENGTH = 20
+
+re_word = re.compile(r"[가-힣]+|[a-z][a-z0-9]+")
+
+# 떼어 낼 조사, 어미 (긴 것부터 검사), "이"는 와이파이처럼 단어 끝과 겹치는 경우가 많아 제외
+SUFFIXES = sorted(
+    [
+        "에서는", "으로는", "이에요", "예요", "에서", "으로", "에는", "이랑", "하고",
+        "해요", "해서", "하게", "했어요", "어요", "아요", "네요", "습니다", "입니다",
+        "이고", "이라", "은", "는", "가", "을", "를", "에", "도", "로", "와", "과", "의",
+        "랑", "고", "요",
+    ],
+    key=len,
+    reverse=True,
+)
+STOPWORDS = {
+    "너무", "정말", "진짜", "완전", "그냥", "조금", "약간", "많이", "아주", "제일",
+    "그리고", "근데", "하지만", "그래서", "있어", "있고", "있는", "없는", "없어",
+    "같아", "같은", "합니다", "했는데", "하는", "이런", "저런", "여기", "거기",
+    "카페", "cafe", "the", "and",
+}
+
+
+def tokenize(text):
+    # 리뷰 하나의 단어 집합 (중복 제거)
+    words = set()
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    for word in re_word.findall(text):
+        for suffix in SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= MIN_LENGTH:
+                word = word[: -len(suffix)]
+                break
+        if MIN_LENGTH <= len(word) <= MAX_LENGTH and word not in STOPWORDS:
+            words.add(word)
+    return words
+
+
+def dumps_wordcloud(counter):
+    # 상위 TOP_K개 (Counter.most_common은 heapq.nlargest로 전체 정렬 없이 고름), 리뷰가 없으면 None
+    if not counter:
+        return None
+    top = counter.most_common(TOP_K)
+    return json.dumps(top, ensure_ascii=False, separators=(",", ":"))
+
+
+def build_wordclouds(start_id, end_id, cafe_ids=None, chunk_size=5000):
+    # start_id <= cafe_id < end_id 인 활성 카페(cafe_ids가 있으면 그 중 일부)의 [(cafe_id, JSON), ...]
+    # 프로세스 풀의 작업 단위, 활성 리뷰가 없는 카페는 None
+    cafes = Cafe.objects.filter(id__gte=start_id, id__lt=end_id)
+    reviews = Review.objects.filter(
+        cafe__is_active=True, cafe_id__gte=start_id, cafe_id__lt=end_id
+    )
+    if cafe_ids is not None:
+        cafes = cafes.filter(id__in=cafe_ids)
+        reviews = reviews.filter(cafe_id__in=cafe_ids)
+    rows = reviews.order_by("cafe_id").values_list("cafe_id", "review")
+
+    try:
+        results = dict.fromkeys(cafes.values_list("id", flat=True))
+        # 카페 순으로 읽으므로 한 번에 한 카페의 Counter만 유지
+        current, counter = None, Counter()
+        for cafe_id, review in rows.iterator(chunk_size=chunk_size):
+            if cafe_id != current:
+                if current is not None:
+                    results[current] = dumps_wordcloud(counter)
+                current, counter = cafe_id, Counter()
+            counter.update(tokenize(review))
+        if current is not None:
+            results[current] = dumps_wordcloud(counter)
+    finally:
+        # 풀의 작업 프로세스가 연결을 쥔 채로 남지 않도록
+        connections.close_all()
+    return list(results.items())
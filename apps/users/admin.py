@@ -1,24 +1,38 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from apps.users.models import User
+from apps.users.user_cache import user_cache
+from apps.users.last_login import last_login_recorder
+
+
+def invalidate_users(pks):
+    # 인증 캐시에 남아 있는 사용자 정보 무효화
+    for pk in pks:
+        user_cache.invalidate(pk)
 
 
 def soft_delete(modeladmin, request, queryset):
-    queryset.update(is_active=False)
+    pks = list(queryset.values_list("pk", flat=True))
+    queryset.delete()
+    invalidate_users(pks)
 
 
 soft_delete.short_description = "선택된 user를 Soft Delete 합니다."
 
 
 def hard_delete(modeladmin, request, queryset):
+    pks = list(queryset.values_list("pk", flat=True))
     queryset.hard_delete()
+    invalidate_users(pks)
 
 
 hard_delete.short_description = "선택된 user를 Hard Delete 합니다."
 
 
 def restore(modeladmin, request, queryset):
+    pks = list(queryset.values_list("pk", flat=True))
     queryset.restore()
+    invalidate_users(pks)
 
 
 restore.short_description = "선택된 user를 Restore 합니다."
@@ -33,6 +47,8 @@ class UserAdmin(admin.ModelAdmin):
         "is_staff",
         "created_at",
         "deleted_at",
+        "last_login",
+        "pending_last_login",
     )
     list_filter = ("is_active",)  # is_active 필터 추가
     actions = [soft_delete, hard_delete, restore]  # restore 액션 추가
@@ -44,6 +60,20 @@ class UserAdmin(admin.ModelAdmin):
 
     is_active.boolean = True  # True/False 아이콘 표시
 
+    def pending_last_login(self, obj):
+        # 워커들에 모여 있고 아직 DB에 기록되지 않은 로그인 시각 (공유 캐시 기준)
+        # flush 후에는 last_login이 같은 값이 되어 "-"로 보인다.
+        timestamp = last_login_recorder.pending(obj.pk)
+        if timestamp is None or (obj.last_login and timestamp <= obj.last_login):
+            return "-"
+        return timestamp
+
+    pending_last_login.short_description = "last_login (기록 대기)"
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        user_cache.invalidate(obj.pk)
+
     def get_queryset(self, request):
         # 모든 유저를 반환하도록 queryset을 수정합니다.
         return User.objects.all_with_deleted()
@@ -0,0 +1,110 @@
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+# FakeGoogleServer 클래스 정의: 로컬 테스트용 Google OAuth 토큰/사용자 정보 서버
+# GOOGLE_OAUTH_TOKEN_URL=http://127.0.0.1:<port>/token
+# GOOGLE_OAUTH_USERINFO_URL=http://127.0.0.1:<port>/userinfo 로 지정해서 사용
+# delay, fail_status로 Google이 느리거나 장애일 때의 동작을 재현할 수 있다.
+class FakeGoogleServer:
+    def __init__(self, host="127.0.0.1", port=0, delay=0, fail_status=None):
+        self.delay = delay  # 응답 전 대기 시간(초)
+        self.fail_status = fail_status  # 지정 시 모든 요청에 이 상태 코드로 응답
+        self.requests = []  # (method, path) 기록
+        self.user_info = {
+            "id": "1234567890",
+            "email": "fake.user@example.com",
+            "name": "fake user",
+        }
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                form = parse_qs(self.rfile.read(length).decode())
+                self.respond(server.token_response(form))
+
+            def do_GET(self):
+                self.respond(server.userinfo_response(urlparse(self.path)))
+
+            def respond(self, result):
+                server.requests.append((self.command, urlparse(self.path).path))
+                if server.delay:
+                    time.sleep(server.delay)
+                status, body = result
+                if server.fail_status:
+                    status, body = server.fail_status, {"error": "unavailable"}
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                try:
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # 클라이언트가 타임아웃으로 먼저 연결을 끊은 경우
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def token_response(self, form):
+        if not form.get("code"):
+            return 400, {"error": "invalid_grant"}
+        return 200, {
+            "access_token": f"fake-access-{form['code'][0]}",
+            "refresh_token": "fake-refresh",
+            "expires_in": 3599,
+            "token_type": "Bearer",
+        }
+
+    def userinfo_response(self, url):
+        if url.path != "/userinfo":
+            return 404, {"error": "not_found"}
+        if not parse_qs(url.query).get("access_token"):
+            return 401, {"error": "invalid_token"}
+        return 200, self.user_info
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    # python -m apps.users.fake_google --port 8765 --delay 2
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0)
+    parser.add_argument("--fail-status", type=int)
+    args = parser.parse_args()
+    server = FakeGoogleServer(
+        port=args.port, delay=args.delay, fail_status=args.fail_status
+    )
+    print(f"fake google: {server.url}/token, {server.url}/userinfo")
+    server.httpd.serve_forever()
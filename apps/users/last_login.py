@@ -0,0 +1,120 @@
+import atexit
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+
+from apps.users.models import User
+from common.db import bulk_update_from_values
+
+logger = logging.getLogger(__name__)
+
+
+# LastLoginRecorder 클래스 정의: 로그인 시각을 메모리에 모아 주기적으로 한 번에 기록
+# 로그인마다 users_user 행을 UPDATE하면 로그인이 몰릴 때 행 잠금 경합이 생기므로
+# 사용자별 가장 최근 시각만 남겨 두었다가 UPDATE ... FROM (VALUES ...) 한 문장으로 반영한다.
+# DB의 last_login은 최대 flush_interval초 늦게 반영된다.
+# 대기 중인 시각은 공유 캐시(alias)에도 올려 두어 관리자 화면에서 모든 워커의 값을 볼 수 있다.
+class LastLoginRecorder:
+    def __init__(self, flush_interval, alias=None):
+        self.flush_interval = flush_interval
+        self.alias = alias
+        self._pending = {}  # user_id: 로그인 시각
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def record(self, user, timestamp):
+        # 응답에 쓰이는 user 객체에는 바로 반영, DB에는 다음 flush 때 반영
+        user.last_login = timestamp
+        if self.flush_interval <= 0:
+            self.write({user.pk: timestamp})
+            return
+        with self._lock:
+            current = self._pending.get(user.pk)
+            if current is None or current < timestamp:
+                self._pending[user.pk] = timestamp
+        self._publish(user.pk, timestamp)
+        self._ensure_thread()
+
+    def pending_key(self, user_id):
+        return f"users:last_login:pending:{user_id}"
+
+    def _publish(self, user_id, timestamp):
+        # 기록 대기 중인 시각을 공유 캐시에 표시 (여러 번 flush할 시간이 지나면 만료)
+        if not self.alias:
+            return
+        try:
+            caches[self.alias].set(
+                self.pending_key(user_id), timestamp, timeout=max(self.flush_interval * 3, 60)
+            )
+        except Exception:
+            logger.warning("#### last_login 대기 시각 공유 실패", exc_info=True)
+
+    def pending(self, user_id):
+        # 아직 DB에 기록되지 않았을 수 있는 로그인 시각 (없으면 None)
+        # 이 프로세스의 값과 공유 캐시의 다른 워커 값 중 최신 값
+        with self._lock:
+            timestamp = self._pending.get(user_id)
+        if self.alias:
+            published = caches[self.alias].get(self.pending_key(user_id))
+            if published is not None and (timestamp is None or timestamp < published):
+                timestamp = published
+        return timestamp
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            return self.write(pending)
+        except Exception:
+            logger.exception("#### last_login 기록 실패: %d명", len(pending))
+            # 실패한 값은 다음 flush에서 다시 시도 (그 사이 들어온 더 최근 값 우선)
+            with self._lock:
+                for user_id, timestamp in pending.items():
+                    current = self._pending.get(user_id)
+                    if current is None or current < timestamp:
+                        self._pending[user_id] = timestamp
+            return 0
+
+    def write(self, pending):
+        # 이미 더 최근 값이 기록된 행은 건드리지 않음
+        return bulk_update_from_values(
+            User,
+            ["last_login"],
+            pending.items(),
+            where="t.last_login IS NULL OR t.last_login < v.last_login",
+        )
+
+    def _ensure_thread(self):
+        # gunicorn preload 후 fork된 워커에는 스레드가 없으므로 프로세스마다 시작
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name="last-login-recorder", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        stop = threading.Event()
+        while not stop.wait(self.flush_interval):
+            self.flush()
+            # 이 스레드가 연 DB 연결 정리
+            connections.close_all()
+
+
+last_login_recorder = LastLoginRecorder(
+    settings.LAST_LOGIN_FLUSH_INTERVAL, alias=settings.USER_CACHE_ALIAS
+)
+# 프로세스 종료 시 남은 값 기록
+atexit.register(last_login_recorder.flush)
@@ -0,0 +1,111 @@
+import threading
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class OAuthProviderError(Exception):
+    # 공급자(Google)에 연결할 수 없거나 응답이 올바르지 않을 때
+    pass
+
+
+# OAuthHTTPClient 클래스 정의: 공급자 API 호출용 연결 풀 세션
+# 요청마다 새 TLS 연결을 맺지 않고 keep-alive 연결을 재사용하며,
+# 모든 호출에 (연결, 읽기) 타임아웃을 걸어 공급자가 느려도 워커가 묶여 있지 않게 한다.
+class OAuthHTTPClient:
+    def __init__(self, timeout, retries, backoff_factor, pool_maxsize):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.pool_maxsize = pool_maxsize
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self.create_session()
+        return self._session
+
+    def create_session(self):
+        # 연결 오류는 모든 메서드에서 재시도 (요청이 전송되기 전)
+        # 읽기 오류와 5xx 응답은 멱등인 GET만 재시도 (인가 코드는 한 번만 사용 가능)
+        retry = Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=self.pool_maxsize, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            raise OAuthProviderError(f"{url} 요청 실패: {e}") from e
+        if response.status_code >= 500:
+            raise OAuthProviderError(f"{url} 응답 오류: {response.status_code}")
+        try:
+            return response.json()
+        except ValueError as e:
+            raise OAuthProviderError(f"{url} 응답이 JSON이 아닙니다") from e
+
+    def fetch_google_token(self, code, redirect_uri, state=None):
+        # 인가 코드로 Google access token 요청
+        return self.request(
+            "POST",
+            settings.GOOGLE_OAUTH_TOKEN_URL,
+            data={
+                "client_id": settings.SOCIAL_AUTH_GOOGLE_CLIENT_ID,
+                "client_secret": settings.SOCIAL_AUTH_GOOGLE_SECRET,
+                "code": code,
+                "grant_type": "authorization_code",
+                "redirect_uri": redirect_uri,
+                "state": state,
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+    def fetch_google_userinfo(self, access_token):
+        # access token으로 Google 사용자 정보 요청
+        return self.request(
+            "GET",
+            settings.GOOGLE_OAUTH_USERINFO_URL,
+            params={"access_token": access_token},
+        )
+
+    # ASGI 뷰용: 블로킹 호출을 이벤트 루프 밖의 스레드 풀에서 실행
+    # thread_sensitive=False이므로 느린 호출이 다른 동기 코드를 막지 않는다.
+    async def afetch_google_token(self, code, redirect_uri, state=None):
+        return await sync_to_async(self.fetch_google_token, thread_sensitive=False)(
+            code, redirect_uri, state
+        )
+
+    async def afetch_google_userinfo(self, access_token):
+        return await sync_to_async(
+            self.fetch_google_userinfo, thread_sensitive=False
+        )(access_token)
+
+
+oauth_client = OAuthHTTPClient(
+    timeout=(settings.OAUTH_CONNECT_TIMEOUT, settings.OAUTH_READ_TIMEOUT),
+    retries=settings.OAUTH_RETRIES,
+    backoff_factor=settings.OAUTH_RETRY_BACKOFF,
+    pool_maxsize=settings.OAUTH_POOL_MAXSIZE,
+)
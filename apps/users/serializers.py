@@ -61,3 +61,10 @@ class UpdateUserSerializer(serializers.ModelSerializer):
                 "A user with this username already exists."
             )
         return value
+
+    def update(self, instance, validated_data):
+        # instance가 캐시된 사용자일 수 있으므로 바꾼 필드만 저장
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
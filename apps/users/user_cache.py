@@ -0,0 +1,97 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.users.models import User
+
+
+# UserCache 클래스 정의: user_id로 User를 찾는 2단계 캐시
+# 1단계: 프로세스 메모리의 LRU, 2단계: django cache(설정 시, 프로세스 간 공유)
+# 공유 캐시에는 사용자별 stamp(updated_at)를 두고, LRU 항목은 stamp가 같을 때만 사용한다.
+# 회원 정보가 바뀌면 invalidate()로 stamp를 지워 모든 프로세스의 LRU 항목을 무효화한다.
+# 비밀번호 해시는 캐시하지 않는다. 캐시의 User는 password가 지연 로딩 필드이므로
+# check_password() 등에서 접근할 때 DB에서 읽고, save()는 로딩된 필드만 저장한다.
+class UserCache:
+    def __init__(self, maxsize, timeout, alias=None):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.alias = alias
+        self._entries = OrderedDict()  # user_id: (stamp, user, 만료 시각)
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self):
+        return caches[self.alias] if self.alias else None
+
+    def stamp_key(self, user_id):
+        return f"users:user:{user_id}:stamp"
+
+    def user_key(self, user_id, stamp):
+        return f"users:user:{user_id}:{stamp}"
+
+    @property
+    def field_names(self):
+        return [
+            field.attname for field in User._meta.concrete_fields if field.name != "password"
+        ]
+
+    def get(self, user_id):
+        # 활성 사용자를 반환, 없으면 None
+        shared = self.shared
+        stamp = shared.get(self.stamp_key(user_id)) if shared else None
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if (
+                entry is not None
+                and entry[2] > time.monotonic()
+                and (shared is None or entry[0] == stamp)
+            ):
+                self._entries.move_to_end(user_id)
+                # 요청마다 수정될 수 있으므로 복사본 반환
+                return copy.copy(entry[1])
+
+        field_names = self.field_names
+        values = shared.get(self.user_key(user_id, stamp)) if stamp else None
+        if values is not None:
+            user = User.from_db(User.objects.db, field_names, values)
+        else:
+            user = User.objects.filter(pk=user_id).defer("password").first()
+            if user is None:
+                return None
+            stamp = user.updated_at.isoformat()
+            if shared:
+                # 모델 객체 대신 password를 제외한 필드 값만 저장
+                shared.set_many(
+                    {
+                        self.stamp_key(user_id): stamp,
+                        self.user_key(user_id, stamp): tuple(
+                            getattr(user, name) for name in field_names
+                        ),
+                    },
+                    timeout=self.timeout,
+                )
+
+        with self._lock:
+            self._entries[user_id] = (stamp, user, time.monotonic() + self.timeout)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return copy.copy(user)
+
+    def invalidate(self, user_id):
+        if self.shared:
+            self.shared.delete(self.stamp_key(user_id))
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+user_cache = UserCache(
+    maxsize=settings.USER_CACHE_SIZE,
+    timeout=settings.USER_CACHE_TIMEOUT,
+    alias=settings.USER_CACHE_ALIAS,
+)
@@ -16,16 +16,16 @@ from drf_yasg import openapi
 from config.settings import (
     SECRET_KEY,
     SOCIAL_AUTH_GOOGLE_CLIENT_ID,
-    SOCIAL_AUTH_GOOGLE_SECRET,
 )
 from django.shortcuts import redirect
 
 from apps.users.serializers import *
 from apps.users.models import *
+from apps.users.user_cache import user_cache
+from apps.users.last_login import last_login_recorder
+from apps.users.oauth import OAuthProviderError, oauth_client
 
-from json import JSONDecodeError
-from django.http import JsonResponse
-import requests
+from django.http import Http404, JsonResponse
 import os
 from rest_framework import status
 from django.contrib.auth.hashers import make_password
@@ -46,41 +46,33 @@ def google_login(request):
 
 
 def google_callback(request):
-    client_id = SOCIAL_AUTH_GOOGLE_CLIENT_ID
-    client_secret = SOCIAL_AUTH_GOOGLE_SECRET
     code = request.GET.get("code")
     state = request.GET.get("state")  # state가 없으면 None을 반환
 
-    # 1. 받은 코드로 구글에 access token 요청
-    token_req = requests.post(
-        "https://oauth2.googleapis.com/token",
-        data={
-            "client_id": client_id,
-            "client_secret": client_secret,
-            "code": code,
-            "grant_type": "authorization_code",
-            "redirect_uri": GOOGLE_CALLBACK_URI,
-            "state": state,
-        },
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-    )
-    token_req_json = token_req.json()
-    error = token_req_json.get("error")
-
-    if error is not None:
-        raise JSONDecodeError(error)
+    # 1. 받은 코드로 구글에 access token 요청, 2. 사용자 정보 요청
+    # 구글이 응답하지 않거나 오류를 반환하면 502
+    try:
+        token_req_json = oauth_client.fetch_google_token(
+            code, GOOGLE_CALLBACK_URI, state
+        )
+        error = token_req_json.get("error")
+        if error is not None:
+            return JsonResponse(
+                {"status": 400, "message": error},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-    google_access_token = token_req_json.get("access_token")
-    google_refresh_token = token_req_json.get("refresh_token")
-    expires_in = token_req_json.get("expires_in")
-    expires_at = datetime.datetime.now() + datetime.timedelta(seconds=expires_in)
+        google_access_token = token_req_json.get("access_token")
+        google_refresh_token = token_req_json.get("refresh_token")
+        expires_in = token_req_json.get("expires_in")
+        expires_at = datetime.datetime.now() + datetime.timedelta(seconds=expires_in)
 
-    # 사용자 정보 요청
-    user_info_response = requests.get(
-        "https://www.googleapis.com/oauth2/v1/userinfo",
-        params={"access_token": google_access_token},
-    )
-    user_info = user_info_response.json()
+        user_info = oauth_client.fetch_google_userinfo(google_access_token)
+    except OAuthProviderError as e:
+        return JsonResponse(
+            {"status": 502, "message": str(e)},
+            status=status.HTTP_502_BAD_GATEWAY,
+        )
 
     email = user_info.get("email")
 
@@ -90,8 +82,7 @@ def google_callback(request):
         access_token = str(token.access_token)
         refresh_token = str(token)
 
-        user.last_login = timezone.now()
-        user.save()
+        last_login_recorder.record(user, timezone.now())
 
         response = JsonResponse(
             {
@@ -160,6 +151,18 @@ def google_callback(request):
         )
 
 
+def get_cached_user_or_404(pk):
+    # user_cache로 조회, 없거나 탈퇴한 사용자면 404
+    user = user_cache.get(pk)
+    if user is None:
+        raise Http404
+    # 아직 DB에 기록되지 않은 로그인 시각 반영
+    pending = last_login_recorder.pending(user.pk)
+    if pending is not None and (user.last_login is None or user.last_login < pending):
+        user.last_login = pending
+    return user
+
+
 class SignupAPIView(APIView):
     @swagger_auto_schema(
         operation_summary="회원가입",
@@ -233,7 +236,7 @@ class AuthAPIView(APIView):
             access = request.COOKIES["access"]
             payload = jwt.decode(access, SECRET_KEY, algorithms=["HS256"])
             pk = payload.get("user_id")
-            user = get_object_or_404(User, pk=pk)
+            user = get_cached_user_or_404(pk)
             serializer = UserSerializer(instance=user)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -246,7 +249,7 @@ class AuthAPIView(APIView):
                 refresh = serializer.data.get("refresh", None)
                 payload = jwt.decode(access, SECRET_KEY, algorithms=["HS256"])
                 pk = payload.get("user_id")
-                user = get_object_or_404(User, pk=pk)
+                user = get_cached_user_or_404(pk)
                 serializer = UserSerializer(instance=user)
                 res = Response(serializer.data, status=status.HTTP_200_OK)
                 res.set_cookie("access", access)
@@ -328,8 +331,7 @@ class AuthAPIView(APIView):
             token = TokenObtainPairSerializer.get_token(user)
             refresh_token = str(token)
             access_token = str(token.access_token)
-            user.last_login = timezone.now()
-            user.save()
+            last_login_recorder.record(user, timezone.now())
             res = Response(
                 {
                     "user": serializer.data,
@@ -392,6 +394,7 @@ class WithdrawalViewAPIView(APIView):
                     status=status.HTTP_401_UNAUTHORIZED,
                 )
             user.delete()
+            user_cache.invalidate(user.pk)
             return Response(status=status.HTTP_204_NO_CONTENT)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -418,7 +421,9 @@ class ChangePasswordAPIView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
             user.password = make_password(serializer.data.get("new_password"))
-            user.save()
+            # request.user는 캐시된 객체이므로 바꾼 컬럼만 저장 (last_login 등을 덮어쓰지 않음)
+            user.save(update_fields=["password", "updated_at"])
+            user_cache.invalidate(user.pk)
 
             return Response(
                 {"message": "Password updated successfully"}, status=status.HTTP_200_OK
@@ -443,6 +448,7 @@ class UpdateUserAPIView(APIView):
         serializer = UpdateUserSerializer(user, data=request.data, partial=True)
         if serializer.is_valid():
             serializer.save()
+            user_cache.invalidate(user.pk)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -495,6 +501,7 @@ class RestoreAccountAPIView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
             user.restore()
+            user_cache.invalidate(user.pk)
             return Response(
                 {"detail": "Account restored successfully."},
                 status=status.HTTP_200_OK,
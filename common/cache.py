@@ -0,0 +1,95 @@
+import logging
+import uuid
+from threading import Lock, Thread
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+# VersionStamp 클래스 정의: django cache에 저장되는 버전 토큰
+# 같은 cache를 공유하는 모든 프로세스(웹 워커, 관리 명령어)가 같은 값을 본다.
+# 번호를 1씩 올리면 키가 캐시에서 밀려난(cull, 재시작) 뒤 다시 1부터 시작해 워커가 가진 예전 버전과
+# 겹칠 수 있으므로, bump 할 때마다 새 uuid를 기록하고 키가 없으면 새 토큰을 만들어 다시 빌드하게 한다.
+class VersionStamp:
+    def __init__(self, key):
+        self.key = key
+
+    def get(self):
+        version = cache.get(self.key)
+        if version is None:
+            # 키가 사라진 경우: 모든 프로세스가 같은 새 토큰을 보도록 add (먼저 기록한 값 사용)
+            token = uuid.uuid4().hex
+            cache.add(self.key, token, timeout=None)
+            version = cache.get(self.key) or token
+        return version
+
+    def bump(self):
+        version = uuid.uuid4().hex
+        cache.set(self.key, version, timeout=None)
+        return version
+
+
+# VersionedSnapshot 클래스 정의: 버전이 바뀔 때만 다시 만드는 프로세스 단위 스냅샷
+# background=True이면 처음 한 번만 요청 안에서 만들고, 이후에는 이전 스냅샷으로 응답하면서
+# 새 스냅샷을 백그라운드 스레드에서 만든 뒤 교체한다. (빌드가 오래 걸리는 스냅샷용)
+class VersionedSnapshot:
+    def __init__(self, stamp, build, background=False):
+        self.stamp = stamp
+        self._build = build
+        self.background = background
+        self._lock = Lock()
+        self._state = (None, None)  # (버전, 값)
+        self._building = False
+
+    def get(self):
+        version = self.stamp.get()
+        state = self._state
+        if state[0] != version:
+            if self.background and state[0] is not None:
+                self._start_build(version)
+                return state[1]
+            with self._lock:
+                state = self._state
+                if state[0] != version:
+                    # 빌드 전에 읽은 버전을 저장하므로, 빌드 중에 bump 되면 다음 요청에서 다시 빌드
+                    state = (version, self._build())
+                    self._state = state
+        return state[1]
+
+    def _start_build(self, version):
+        # 프로세스당 하나의 빌드 스레드만 실행
+        with self._lock:
+            if self._building:
+                return
+            self._building = True
+        Thread(
+            target=self._build_in_background,
+            args=(version,),
+            name="versioned-snapshot-build",
+            daemon=True,
+        ).start()
+
+    def _build_in_background(self, version):
+        try:
+            value = self._build()
+            with self._lock:
+                self._state = (version, value)
+        except Exception:
+            # 이전 스냅샷을 유지하고 다음 요청에서 다시 시도
+            logger.exception("#### %s 스냅샷 빌드 실패", self.stamp.key)
+        finally:
+            self._building = False
+            # 이 스레드가 연 DB 연결 정리
+            connections.close_all()
+
+    async def aget(self):
+        # 비동기 뷰용: 버전 확인(캐시 조회)은 스레드 풀에서 병렬로 실행하고, 스냅샷이 최신이면 바로 반환
+        # 다시 빌드해야 할 때만 DB 연결을 쓰는 thread_sensitive 스레드에서 get() 실행
+        version = await sync_to_async(self.stamp.get, thread_sensitive=False)()
+        state = self._state
+        if state[0] == version:
+            return state[1]
+        return await sync_to_async(self.get)()
@@ -0,0 +1,85 @@
+from django.db import connections, router
+
+
+def bulk_update_from_values(
+    model, fields, rows, where=None, batch_size=1000, using=None
+):
+    # rows의 (pk, 값1, 값2, ...)를 UPDATE ... FROM (VALUES ...) 한 문장으로 반영 (PostgreSQL)
+    # bulk_update의 CASE WHEN 식과 달리 행 수가 늘어도 SQL이 단순하고 계획 비용이 작다.
+    # where: 추가 조건 SQL, 대상 테이블은 t, 새 값은 v로 참조 (예: "t.score < v.score")
+    # 반환값: 갱신된 행 수
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    opts = model._meta
+    columns = [opts.pk] + [opts.get_field(name) for name in fields]
+    # VALUES의 파라미터는 타입을 알 수 없으므로 컬럼 타입으로 캐스팅
+    placeholder = "({})".format(
+        ", ".join(
+            f"CAST(%s AS {field.cast_db_type(connection)})" for field in columns
+        )
+    )
+    assignments = ", ".join(
+        f"{quote(field.column)} = v.{quote(field.column)}" for field in columns[1:]
+    )
+    aliases = ", ".join(quote(field.column) for field in columns)
+    pk_column = quote(opts.pk.column)
+    condition = f"t.{pk_column} = v.{pk_column}"
+    if where:
+        condition += f" AND ({where})"
+
+    rows = list(rows)
+    updated = 0
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            params = []
+            for row in batch:
+                params.extend(
+                    field.get_db_prep_save(value, connection)
+                    for field, value in zip(columns, row)
+                )
+            cursor.execute(
+                f"UPDATE {quote(opts.db_table)} AS t SET {assignments} "
+                f"FROM (VALUES {', '.join([placeholder] * len(batch))}) "
+                f"AS v ({aliases}) WHERE {condition}",
+                params,
+            )
+            updated += cursor.rowcount
+    return updated
+
+
+def bulk_insert_ignore_conflicts(model, objs, returning=("pk",), batch_size=1000, using=None):
+    # objs를 INSERT ... ON CONFLICT DO NOTHING RETURNING 으로 저장 (PostgreSQL)
+    # bulk_create(ignore_conflicts=True)와 같지만 유니크 제약과 충돌해 건너뛴 행을 구분할 수 있다.
+    # 반환값: 실제로 저장된 행의 returning 필드 값 튜플 목록
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    opts = model._meta
+    fields = [field for field in opts.concrete_fields if field is not opts.pk]
+    returning = [opts.pk if name == "pk" else opts.get_field(name) for name in returning]
+    placeholder = "({})".format(", ".join(["%s"] * len(fields)))
+    columns = ", ".join(quote(field.column) for field in fields)
+    returning_columns = ", ".join(quote(field.column) for field in returning)
+
+    objs = list(objs)
+    inserted = []
+    with connection.cursor() as cursor:
+        for start in range(0, len(objs), batch_size):
+            batch = objs[start : start + batch_size]
+            params = []
+            for obj in batch:
+                # pre_save: auto_now_add 등 저장 시점에 정해지는 값
+                params.extend(
+                    field.get_db_prep_save(field.pre_save(obj, True), connection)
+                    for field in fields
+                )
+            cursor.execute(
+                f"INSERT INTO {quote(opts.db_table)} ({columns}) "
+                f"VALUES {', '.join([placeholder] * len(batch))} "
+                f"ON CONFLICT DO NOTHING RETURNING {returning_columns}",
+                params,
+            )
+            inserted.extend(tuple(row) for row in cursor.fetchall())
+    return inserted
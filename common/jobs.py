@@ -0,0 +1,56 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from common.models import JobWatermark
+
+# 관리 명령어(compute_cagong_scores, build_wordclouds)의 배치 계산 공통 함수
+
+TASKS_PER_WORKER = 4  # 작업별 데이터 양 편차를 줄이기 위해 작업을 작업자 수보다 잘게 나눔
+
+
+def run_tasks(func, tasks, workers):
+    # tasks의 각 인자 튜플로 func를 실행하고, 결과 목록들을 이어 붙여 반환
+    # workers개의 fork 프로세스에서 계산 (1이거나 작업이 하나면 현재 프로세스에서 실행)
+    # func는 끝날 때 DB 연결을 닫아야 한다. (풀의 프로세스가 연결을 쥔 채로 남지 않도록)
+    results = []
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            results.extend(func(*task))
+        return results
+
+    # fork된 작업 프로세스가 부모의 DB 연결을 공유하지 않도록 먼저 닫음
+    connections.close_all()
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        for result in pool.map(func, *zip(*tasks)):
+            results.extend(result)
+    return results
+
+
+def changed_since(model, since):
+    # since 이후 작성/수정/삭제된 행 (soft delete된 행 포함)
+    return model.all_objects.filter(Q(updated_at__gt=since) | Q(deleted_at__gt=since))
+
+
+# Watermark 클래스 정의: 마지막 실행 이후 바뀐 데이터만 처리하는 증분 실행의 기준 시각
+# 실행 시작 시각을 기록하므로 실행 중에 바뀐 데이터는 다음 실행에서 다시 처리된다.
+class Watermark:
+    def __init__(self, name):
+        self.name = name
+        self.started_at = timezone.now()
+
+    def get(self):
+        # 마지막으로 성공한 실행의 시작 시각 (처음 실행이면 None)
+        return JobWatermark.get_value(self.name)
+
+    @contextmanager
+    def advance(self):
+        # 결과를 쓰는 트랜잭션, 블록이 성공하면 같은 트랜잭션에서 워터마크를 실행 시작 시각으로 갱신
+        with transaction.atomic():
+            yield
+            JobWatermark.set_value(self.name, self.started_at)
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from config.openapi import SchemaStore, generate_schema, schema_store, urlconf_fingerprint
+
+
+class Command(BaseCommand):
+    help = (
+        "OpenAPI 스키마(schema.json, schema.yaml)를 생성해 파일로 저장합니다. "
+        "서버는 URLconf와 뷰, serializer 소스가 같으면 이 파일을 그대로 읽어 응답합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            default=None,
+            help="저장 위치 (기본값: settings.OPENAPI_SCHEMA_DIR)",
+        )
+
+    def handle(self, *args, **options):
+        store = SchemaStore(options["output_dir"] or schema_store.directory)
+        fingerprint = urlconf_fingerprint()
+        bodies = generate_schema()
+        store.write(bodies, fingerprint)
+        for format, body in bodies.items():
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{store.path(f'schema.{format}')} ({len(body)} bytes)"
+                )
+            )
+        self.stdout.write(f"urlconf fingerprint: {fingerprint}")
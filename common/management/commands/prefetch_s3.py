@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from common.utils import fetch_many_from_s3
+
+
+class Command(BaseCommand):
+    help = "S3 객체들을 로컬 캐시에 병렬로 내려받습니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("bucket", help="S3 버킷 이름")
+        parser.add_argument("keys", nargs="+", help="내려받을 객체 키 목록")
+        parser.add_argument("--workers", type=int, default=None, help="동시 다운로드 수")
+
+    def handle(self, *args, **options):
+        paths = fetch_many_from_s3(
+            options["bucket"], options["keys"], max_workers=options["workers"]
+        )
+        for key, path in paths.items():
+            self.stdout.write(self.style.SUCCESS(f"{key} → {path}"))
@@ -0,0 +1,26 @@
+from django.db import connection
+from django.http import HttpResponse, JsonResponse
+
+
+# HealthCheckMiddleware 클래스 정의: 로드밸런서, 컨테이너 헬스 체크용 엔드포인트
+# MIDDLEWARE의 맨 앞에 두어 세션, 인증, CSRF 등을 거치지 않고 응답한다.
+# /healthz: 프로세스가 요청을 처리할 수 있는지만 확인 (DB 조회 없음)
+# /readyz: DB에 SELECT 1을 실행해 요청을 받을 준비가 되었는지 확인
+class HealthCheckMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == "/healthz":
+            return HttpResponse("ok", content_type="text/plain")
+        if request.path == "/readyz":
+            return self.readiness()
+        return self.get_response(request)
+
+    def readiness(self):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except Exception as e:
+            return JsonResponse({"status": "unavailable", "database": str(e)}, status=503)
+        return JsonResponse({"status": "ok"})
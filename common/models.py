@@ -1,12 +1,115 @@
-from django.db import models
+from functools import lru_cache
+
+from django.db import connections, models, router, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 
+def recount_counters(parent_model, queryset=None):
+    # parent_model을 가리키는 자식 모델들의 counter_fields를 활성 자식 수로 다시 계산
+    # 모든 카운터 컬럼을 한 번의 UPDATE ... SET col = (SELECT COUNT(*) ...) 로 갱신
+    updates = {}
+    for related_object in parent_model._meta.related_objects:
+        child_model = related_object.related_model
+        field_name = related_object.field.name
+        counter = getattr(child_model, "counter_fields", {}).get(field_name)
+        if counter is None:
+            continue
+        counts = (
+            child_model.all_objects.filter(
+                **{field_name: OuterRef("pk")}, is_active=True
+            )
+            .order_by()
+            .values(field_name)
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        updates[counter] = Coalesce(Subquery(counts), 0)
+    if not updates:
+        return 0
+    if queryset is None:
+        queryset = parent_model.all_objects.all()
+    return queryset.update(**updates)
+
+
+@lru_cache(maxsize=None)
+def get_cascade_tree(model, path=()):
+    # model을 참조하는 소프트 삭제 모델들의 관계 그래프를 모델별로 한 번만 계산
+    # ((자식 모델, 외래키 필드 이름, 자식의 하위 트리), ...)
+    path = path + (model,)
+    tree = []
+    for related_object in model._meta.related_objects:
+        child_model = related_object.related_model
+        if related_object.many_to_many or not issubclass(child_model, SoftDeleteModel):
+            continue
+        if child_model in path:
+            continue  # 순환 참조 방지
+        tree.append(
+            (
+                child_model,
+                related_object.field.name,
+                get_cascade_tree(child_model, path),
+            )
+        )
+    return tuple(tree)
+
+
+def _recount_parents(model, changed):
+    # changed 행들이 가리키는 부모의 카운터를 다시 계산
+    for field_name in model.counter_fields:
+        parent_model = model._meta.get_field(field_name).related_model
+        recount_counters(
+            parent_model,
+            parent_model.all_objects.filter(pk__in=changed.values(field_name)),
+        )
+
+
+def _cascade_delete(tree, parents, deleted_at):
+    # 전위 순회: 관계마다 UPDATE ... WHERE fk IN (부모 서브쿼리) 한 번으로 활성 자손을 삭제
+    # 같은 deleted_at으로 표시해 두어 다음 단계의 부모 집합과 복구 대상을 구분한다.
+    for child_model, field_name, subtree in tree:
+        related = child_model.all_objects.filter(
+            **{f"{field_name}__in": parents.values("pk")}
+        )
+        related.filter(is_active=True).update(is_active=False, deleted_at=deleted_at)
+        deleted = related.filter(is_active=False, deleted_at=deleted_at)
+        _recount_parents(child_model, deleted)
+        _cascade_delete(subtree, deleted, deleted_at)
+
+
+def _cascade_restore(tree, parents, restored_at):
+    # 후위 순회: 부모의 deleted_at이 남아 있는 동안 부모와 같은 시각에 삭제된 자손만 찾아 복구
+    # (부모보다 먼저 따로 삭제된 행은 복구하지 않음)
+    for child_model, field_name, subtree in tree:
+        related = child_model.all_objects.filter(
+            **{f"{field_name}__in": parents.values("pk")}
+        )
+        deleted = related.filter(
+            is_active=False, deleted_at=F(f"{field_name}__deleted_at")
+        )
+        _cascade_restore(subtree, deleted, restored_at)
+        deleted.update(is_active=True, deleted_at=None, updated_at=restored_at)
+        _recount_parents(
+            child_model, related.filter(is_active=True, updated_at=restored_at)
+        )
+
+
 # SoftDeleteQuerySet 클래스 정의: 소프트 삭제 관련 쿼리셋 메소드 제공
 class SoftDeleteQuerySet(models.QuerySet):
     def delete(self):
-        # 소프트 삭제: is_active를 False로, deleted_at을 현재 시간으로 설정
-        return self.update(is_active=False, deleted_at=timezone.now())
+        # 소프트 삭제: is_active를 False로, deleted_at을 현재 시간으로 설정하고 연관된 객체에 전파
+        deleted_at = timezone.now()
+        with transaction.atomic(using=self.db):
+            count = self.filter(is_active=True).update(
+                is_active=False, deleted_at=deleted_at
+            )
+            deleted = self.model.all_objects.filter(
+                is_active=False, deleted_at=deleted_at
+            )
+            _recount_parents(self.model, deleted)
+            _cascade_delete(get_cascade_tree(self.model), deleted, deleted_at)
+        return count
 
     def hard_delete(self):
         # 실제 삭제
@@ -21,8 +124,19 @@ class SoftDeleteQuerySet(models.QuerySet):
         return self.filter(is_active=False)
 
     def restore(self):
-        # 복구: is_active를 True로, deleted_at을 None으로 설정
-        return self.update(is_active=True, deleted_at=None)
+        # 복구: is_active를 True로, deleted_at을 None으로 설정하고 함께 삭제된 객체도 복구
+        restored_at = timezone.now()
+        with transaction.atomic(using=self.db):
+            deleted = self.filter(is_active=False)
+            _cascade_restore(get_cascade_tree(self.model), deleted, restored_at)
+            count = deleted.update(
+                is_active=True, deleted_at=None, updated_at=restored_at
+            )
+            _recount_parents(
+                self.model,
+                self.model.all_objects.filter(is_active=True, updated_at=restored_at),
+            )
+        return count
 
 
 # SoftDeleteManager 클래스 정의: 커스텀 매니저로 쿼리셋 메소드 활용
@@ -47,6 +161,53 @@ class SoftDeleteManager(models.Manager):
     def restore(self):
         return self.all_with_deleted().restore()
 
+    def activate(self, **lookup):
+        # lookup(예: user_id=1, cafe_id=2)의 활성 행을 하나만 유지하며 활성화 (찜 토글 등)
+        # 1) 활성 행이 없으면 가장 최근에 삭제된 행을 복구하고 2) 그것도 없으면
+        # INSERT ... ON CONFLICT DO NOTHING으로 생성한다. 같은 요청이 동시에 와도 활성 행은 하나.
+        # lookup 컬럼에 is_active 행의 부분 유니크 제약이 있어야 하고, 나머지 컬럼은 NULL 허용이어야 한다.
+        # 반환값: (활성 행의 pk, 이번 호출로 활성화되었는지)
+        model = self.model
+        opts = model._meta
+        using = router.db_for_write(model)
+        connection = connections[using]
+        quote = connection.ops.quote_name
+        table = quote(opts.db_table)
+        pk = quote(opts.pk.column)
+
+        fields = [opts.get_field(name) for name in lookup]
+        columns = ", ".join(quote(field.column) for field in fields)
+        condition = " AND ".join(f"{quote(field.column)} = %s" for field in fields)
+        values = [
+            field.get_db_prep_value(value, connection)
+            for field, value in zip(fields, lookup.values())
+        ]
+        now = opts.get_field("updated_at").get_db_prep_value(timezone.now(), connection)
+
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            # 활성 행이 있으면 그 행이 선택되어 NOT is_active 조건으로 아무것도 바꾸지 않음
+            cursor.execute(
+                f"UPDATE {table} SET is_active = TRUE, deleted_at = NULL, updated_at = %s "
+                f"WHERE {pk} = (SELECT {pk} FROM {table} WHERE {condition} "
+                f"ORDER BY is_active DESC, {pk} DESC LIMIT 1) AND NOT is_active "
+                f"RETURNING {pk}",
+                [now, *values],
+            )
+            row = cursor.fetchone()
+            if row is None:
+                cursor.execute(
+                    f"INSERT INTO {table} ({columns}, is_active, updated_at) "
+                    f"VALUES ({', '.join(['%s'] * len(values))}, TRUE, %s) "
+                    f"ON CONFLICT ({columns}) WHERE is_active DO NOTHING RETURNING {pk}",
+                    [*values, now],
+                )
+                row = cursor.fetchone()
+            if row is None:
+                # 이미 활성 상태 (다른 요청이 먼저 활성화한 경우 포함)
+                return self.filter(**lookup).values_list("pk", flat=True).get(), False
+            model(pk=row[0], **lookup)._update_counters(1)
+        return row[0], True
+
 
 # SoftDeleteModel 추상 클래스 정의: 소프트 삭제를 지원하는 모델
 class SoftDeleteModel(models.Model):
@@ -57,9 +218,22 @@ class SoftDeleteModel(models.Model):
     objects = SoftDeleteManager()  # 기본 매니저 교체
     all_objects = models.Manager()  # 기본 매니저 유지
 
+    # 부모 모델에 비정규화된 활성 행 개수: {"외래키 필드": "부모의 카운터 필드"}
+    # 예) CafeLike.counter_fields = {"cafe": "like_count"}
+    counter_fields = {}
+
     class Meta:
         abstract = True  # 추상 클래스 선언
 
+    def save(self, *args, **kwargs):
+        if not (self.counter_fields and self._state.adding):
+            return super().save(*args, **kwargs)
+        # 생성과 카운터 증가를 하나의 트랜잭션으로 처리
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if self.is_active:
+                self._update_counters(1)
+
     def delete(self, using=None, keep_parents=False):
         # 삭제 메소드: 소프트 삭제 및 연관된 객체도 소프트 삭제
         self._soft_delete()
@@ -72,28 +246,72 @@ class SoftDeleteModel(models.Model):
         # 실제 삭제 메소드
         super().delete(using=using, keep_parents=keep_parents)
 
+    def _update_counters(self, delta):
+        # 부모 카운터를 F() 식으로 증감 (동시 요청에도 값이 유실되지 않음)
+        for field_name, counter in self.counter_fields.items():
+            field = self._meta.get_field(field_name)
+            parent_id = getattr(self, field.attname)
+            if parent_id is not None:
+                field.related_model.all_objects.filter(pk=parent_id).update(
+                    **{counter: F(counter) + delta}
+                )
+
+    @transaction.atomic
     def _soft_delete(self):
         # 소프트 삭제 동작
+        # 활성 행일 때만 바꾸는 조건부 UPDATE: 같은 행을 동시에 삭제해도 한 요청만 반영되어
+        # 카운터 감소와 연관 객체 삭제도 한 번만 일어난다.
+        deleted_at = timezone.now()
+        changed = type(self).all_objects.filter(pk=self.pk, is_active=True).update(
+            is_active=False, deleted_at=deleted_at
+        )
         self.is_active = False
-        self.deleted_at = timezone.now()
-        self.save(update_fields=["is_active", "deleted_at"])  # 변경된 필드만 업데이트
-        self._cascade_update(is_active=False, deleted_at=self.deleted_at)
+        if not changed:
+            return
+        self.deleted_at = deleted_at
+        self._update_counters(-1)
+        # 연관된 모든 객체를 관계마다 한 번의 UPDATE로 소프트 삭제
+        _cascade_delete(
+            get_cascade_tree(type(self)),
+            type(self).all_objects.filter(pk=self.pk),
+            deleted_at,
+        )
 
+    @transaction.atomic
     def _restore(self):
         # 복구 동작
+        # 삭제된 행일 때만 바꾸는 조건부 UPDATE (동시에 복구해도 카운터는 한 번만 증가)
+        # 함께 삭제된 연관 객체를 찾는 데 deleted_at이 필요하므로 연관 객체 복구 후에 지운다.
+        restored_at = timezone.now()
+        rows = type(self).all_objects.filter(pk=self.pk)
+        changed = rows.filter(is_active=False).update(
+            is_active=True, updated_at=restored_at
+        )
         self.is_active = True
+        if not changed:
+            return
+        _cascade_restore(get_cascade_tree(type(self)), rows, restored_at)
+        rows.update(deleted_at=None)
         self.deleted_at = None
-        self.updated_at = timezone.now()
-        self.save(
-            update_fields=["is_active", "deleted_at", "updated_at"]
-        )  # 변경된 필드만 업데이트
-        self._cascade_update(
-            is_active=True, deleted_at=None, updated_at=self.updated_at
-        )
+        self.updated_at = restored_at
+        self._update_counters(1)
+
+
+# JobWatermark 모델 정의: 배치 작업(관리 명령어)의 마지막 처리 시점
+# 증분 실행 시 이 시점 이후에 바뀐 데이터만 처리한다.
+class JobWatermark(models.Model):
+    name = models.CharField(max_length=100, unique=True)  # 작업 이름
+    value = models.DateTimeField()  # 이 시점까지의 변경은 처리 완료
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.value}"
+
+    @classmethod
+    def get_value(cls, name):
+        # 기록이 없으면 None (처음 실행)
+        return cls.objects.filter(name=name).values_list("value", flat=True).first()
 
-    def _cascade_update(self, **kwargs):
-        # 연관된 모든 객체 업데이트
-        for related_object in self._meta.related_objects:
-            related_manager = getattr(self, related_object.get_accessor_name(), None)
-            if related_manager:
-                related_manager.all().update(**kwargs)
+    @classmethod
+    def set_value(cls, name, value):
+        cls.objects.update_or_create(name=name, defaults={"value": value})
@@ -0,0 +1,312 @@
+import os
+import tempfile
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.cagong.models import Area, Cafe, CafeLike, Review, ReviewLike
+from apps.users.models import User
+
+from common.cache import VersionStamp, VersionedSnapshot
+from common.utils import (
+    LocalS3Client,
+    fetch_from_s3,
+    fetch_many_from_s3,
+    get_data_from_s3,
+    iter_parquet_batches_from_s3,
+    set_s3_client,
+)
+
+BUCKET = "test-bucket"
+
+
+# CountingS3Client 클래스 정의: get_object 호출 수를 세는 파일 시스템 client
+class CountingS3Client(LocalS3Client):
+    def __init__(self, root, fail=False):
+        super().__init__(root)
+        self.fail = fail
+        self.get_calls = 0
+
+    def get_object(self, Bucket, Key, **kwargs):
+        self.get_calls += 1
+        if self.fail:
+            raise RuntimeError("PreconditionFailed")
+        return super().get_object(Bucket, Key, **kwargs)
+
+
+class S3CacheTest(SimpleTestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        self.addCleanup(self.cache_dir.cleanup)
+        self.addCleanup(set_s3_client, None)
+        os.makedirs(os.path.join(self.root.name, BUCKET, "data"))
+        self.client = CountingS3Client(self.root.name)
+        set_s3_client(self.client)
+
+    def put(self, key, body):
+        path = os.path.join(self.root.name, BUCKET, key)
+        with open(path, "wb") as f:
+            f.write(body)
+        return path
+
+    def cache_files(self):
+        return sorted(os.listdir(self.cache_dir.name))
+
+    def test_fetch_downloads_once_per_etag(self):
+        self.put("data/a.txt", b"hello")
+        path = fetch_from_s3(BUCKET, "data/a.txt", self.cache_dir.name)
+        self.assertEqual(fetch_from_s3(BUCKET, "data/a.txt", self.cache_dir.name), path)
+        self.assertEqual(self.client.get_calls, 1)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"hello")
+
+    def test_fetch_again_when_object_changes(self):
+        source = self.put("data/a.txt", b"hello")
+        old_path = fetch_from_s3(BUCKET, "data/a.txt", self.cache_dir.name)
+        self.put("data/a.txt", b"hello, world")
+        os.utime(source, ns=(0, os.stat(source).st_mtime_ns + 1))
+        new_path = fetch_from_s3(BUCKET, "data/a.txt", self.cache_dir.name)
+        self.assertNotEqual(new_path, old_path)
+        self.assertEqual(self.client.get_calls, 2)
+        with open(new_path, "rb") as f:
+            self.assertEqual(f.read(), b"hello, world")
+
+    def test_failed_download_leaves_no_file_or_fd(self):
+        self.put("data/a.txt", b"hello")
+        set_s3_client(CountingS3Client(self.root.name, fail=True))
+        fds = len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else None
+        with self.assertRaises(RuntimeError):
+            fetch_from_s3(BUCKET, "data/a.txt", self.cache_dir.name)
+        self.assertEqual(self.cache_files(), [])
+        if fds is not None:
+            self.assertEqual(len(os.listdir("/proc/self/fd")), fds)
+
+    def test_fetch_many(self):
+        keys = [f"data/{name}.txt" for name in "abc"]
+        for key in keys:
+            self.put(key, key.encode())
+        paths = fetch_many_from_s3(BUCKET, keys, self.cache_dir.name, max_workers=3)
+        self.assertEqual(list(paths), keys)
+        for key, path in paths.items():
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), key.encode())
+
+    def test_get_data(self):
+        self.put("data/a.txt", b"hello")
+        self.assertEqual(get_data_from_s3(BUCKET, "data/a.txt"), b"hello")
+
+    def test_iter_parquet_batches(self):
+        table = pa.table({"id": list(range(10)), "name": [f"n{i}" for i in range(10)]})
+        pq.write_table(
+            table, os.path.join(self.root.name, BUCKET, "data/t.parquet"), row_group_size=4
+        )
+        batches = list(
+            iter_parquet_batches_from_s3(BUCKET, "data/t.parquet", columns=["id"], batch_size=3)
+        )
+        self.assertTrue(all(batch.num_rows <= 3 for batch in batches))
+        self.assertEqual(batches[0].schema.names, ["id"])
+        self.assertEqual(
+            [value for batch in batches for value in batch.column("id").to_pylist()],
+            list(range(10)),
+        )
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class VersionedSnapshotTest(SimpleTestCase):
+    def setUp(self):
+        self.stamp = VersionStamp("test:snapshot:version")
+        self.builds = 0
+        self.snapshot = VersionedSnapshot(self.stamp, self.build)
+        self.addCleanup(cache.delete, self.stamp.key)
+
+    def build(self):
+        self.builds += 1
+        return self.builds
+
+    def test_rebuild_only_after_bump(self):
+        self.assertEqual(self.snapshot.get(), 1)
+        self.assertEqual(self.snapshot.get(), 1)
+        self.stamp.bump()
+        self.assertEqual(self.snapshot.get(), 2)
+
+    def test_rebuild_when_stamp_is_evicted(self):
+        # 버전 키가 캐시에서 지워진 뒤 bump 해도 예전 버전과 겹치지 않음
+        self.stamp.bump()
+        self.assertEqual(self.snapshot.get(), 1)
+        cache.delete(self.stamp.key)
+        self.stamp.bump()
+        self.assertEqual(self.snapshot.get(), 2)
+        # bump 없이 지워진 경우에도 다시 빌드
+        cache.delete(self.stamp.key)
+        self.assertEqual(self.snapshot.get(), 3)
+        self.assertEqual(self.snapshot.get(), 3)
+
+
+class SoftDeleteCascadeTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.writer = User.objects.create_user("writer@test.com", username="writer")
+        cls.reader = User.objects.create_user("reader@test.com", username="reader")
+        area = Area.objects.create(
+            id=1,
+            city_code=11,
+            city_name="서울",
+            county_code=110,
+            county_name="종로구",
+            town_code=1101,
+            town_name="청운동",
+        )
+        cls.cafe = Cafe.objects.create(area=area, name="카페", addr="서울", lat=0, lng=0)
+        cls.review = Review.objects.create(user=cls.writer, cafe=cls.cafe, review="좋아요")
+        cls.other_review = Review.objects.create(
+            user=cls.reader, cafe=cls.cafe, review="조용해요"
+        )
+        cls.cafe_like = CafeLike.objects.create(user=cls.reader, cafe=cls.cafe)
+        cls.review_like = ReviewLike.objects.create(user=cls.reader, review=cls.review)
+
+    def assertActive(self, *objs, active=True):
+        for obj in objs:
+            obj.refresh_from_db()
+            self.assertEqual(obj.is_active, active, obj)
+            self.assertEqual(obj.deleted_at is None, active, obj)
+
+    def assertCounts(self, like_count, review_count):
+        self.cafe.refresh_from_db()
+        self.assertEqual(
+            (self.cafe.like_count, self.cafe.review_count), (like_count, review_count)
+        )
+
+    def test_counters_on_create(self):
+        self.assertCounts(1, 2)
+
+    def test_cafe_delete_and_restore(self):
+        # 카페보다 먼저 따로 삭제된 리뷰는 카페를 복구해도 삭제 상태 유지
+        self.other_review.delete()
+        deleted_at = Review.all_objects.get(pk=self.other_review.pk).deleted_at
+        self.assertCounts(1, 1)
+
+        self.cafe.delete()
+        self.assertActive(
+            self.cafe, self.review, self.cafe_like, self.review_like, active=False
+        )
+        self.assertCounts(0, 0)
+
+        self.cafe.restore()
+        self.assertActive(self.cafe, self.review, self.cafe_like, self.review_like)
+        self.assertActive(self.other_review, active=False)
+        self.assertEqual(self.other_review.deleted_at, deleted_at)
+        self.assertCounts(1, 1)
+
+    def test_user_delete_and_restore(self):
+        # 사용자보다 먼저 따로 취소된 찜은 사용자를 복구해도 취소 상태 유지
+        self.cafe_like.delete()
+        self.assertCounts(0, 2)
+
+        self.reader.delete()
+        self.assertActive(self.reader, self.other_review, self.review_like, active=False)
+        self.assertActive(self.cafe, self.review, self.writer)
+        self.assertCounts(0, 1)
+
+        self.reader.restore()
+        self.assertActive(self.reader, self.other_review, self.review_like)
+        self.assertActive(self.cafe_like, active=False)
+        self.assertCounts(0, 2)
+
+    def test_queryset_delete_and_restore(self):
+        self.review.delete()
+        self.assertActive(self.review_like, active=False)
+
+        self.assertEqual(Cafe.objects.filter(pk=self.cafe.pk).delete(), 1)
+        self.assertActive(self.other_review, self.cafe_like, active=False)
+        self.assertCounts(0, 0)
+
+        self.assertEqual(Cafe.objects.inactive().filter(pk=self.cafe.pk).restore(), 1)
+        self.assertActive(self.cafe, self.other_review, self.cafe_like)
+        self.assertActive(self.review, self.review_like, active=False)
+        self.assertCounts(1, 1)
+
+    def test_delete_and_restore_twice(self):
+        # 이미 삭제/복구된 행을 다시 삭제/복구해도 카운터는 한 번만 바뀜
+        self.review.delete()
+        Review.all_objects.get(pk=self.review.pk).delete()
+        self.assertCounts(1, 1)
+        self.review.restore()
+        Review.all_objects.get(pk=self.review.pk).restore()
+        self.assertCounts(1, 2)
+        self.assertActive(self.review, self.review_like)
+
+
+class SoftDeleteActivateTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("like@test.com", username="like")
+        area = Area.objects.create(
+            id=1,
+            city_code=11,
+            city_name="서울",
+            county_code=110,
+            county_name="종로구",
+            town_code=1101,
+            town_name="청운동",
+        )
+        cls.cafe = Cafe.objects.create(area=area, name="카페", addr="서울", lat=0, lng=0)
+
+    def like_count(self):
+        self.cafe.refresh_from_db()
+        return self.cafe.like_count
+
+    def test_activate_creates_once(self):
+        pk, created = CafeLike.objects.activate(user_id=self.user.pk, cafe_id=self.cafe.pk)
+        self.assertTrue(created)
+        self.assertEqual(self.like_count(), 1)
+
+        # 이미 활성 상태면 아무것도 바꾸지 않음
+        self.assertEqual(
+            CafeLike.objects.activate(user_id=self.user.pk, cafe_id=self.cafe.pk),
+            (pk, False),
+        )
+        self.assertEqual(self.like_count(), 1)
+        self.assertEqual(CafeLike.all_objects.filter(cafe=self.cafe).count(), 1)
+
+    def test_activate_restores_deleted_like(self):
+        pk, _ = CafeLike.objects.activate(user_id=self.user.pk, cafe_id=self.cafe.pk)
+        CafeLike.objects.get(pk=pk).delete()
+        self.assertEqual(self.like_count(), 0)
+
+        # 삭제된 행을 새로 만들지 않고 복구하며, 카운터는 한 번만 증가
+        self.assertEqual(
+            CafeLike.objects.activate(user_id=self.user.pk, cafe_id=self.cafe.pk),
+            (pk, True),
+        )
+        self.assertEqual(self.like_count(), 1)
+        like = CafeLike.all_objects.get(pk=pk)
+        self.assertTrue(like.is_active)
+        self.assertIsNone(like.deleted_at)
+
+        self.assertEqual(
+            CafeLike.objects.activate(user_id=self.user.pk, cafe_id=self.cafe.pk),
+            (pk, False),
+        )
+        self.assertEqual(self.like_count(), 1)
+        self.assertEqual(CafeLike.all_objects.filter(cafe=self.cafe).count(), 1)
+
+    def test_activate_review_like(self):
+        review = Review.objects.create(user=self.user, cafe=self.cafe, review="좋아요")
+        pk, created = ReviewLike.objects.activate(user_id=self.user.pk, review_id=review.pk)
+        self.assertTrue(created)
+        ReviewLike.objects.get(pk=pk).delete()
+        self.assertEqual(
+            ReviewLike.objects.activate(user_id=self.user.pk, review_id=review.pk),
+            (pk, True),
+        )
+        self.assertEqual(
+            ReviewLike.objects.activate(user_id=self.user.pk, review_id=review.pk),
+            (pk, False),
+        )
+        self.assertEqual(ReviewLike.objects.filter(review=review).count(), 1)
@@ -1,26 +1,128 @@
+import hashlib
 import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 import pandas as pd
-from io import BytesIO
+import pyarrow.parquet as pq
 
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 AWS_S3_REGION_NAME = os.getenv("AWS_S3_REGION_NAME")
+# moto server, minio 등 S3 호환 엔드포인트를 사용할 때 지정
+AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL")
+# 지정하면 S3 대신 <S3_LOCAL_ROOT>/<bucket>/<key> 파일을 사용 (로컬 개발, CI)
+S3_LOCAL_ROOT = os.getenv("S3_LOCAL_ROOT")
+S3_CACHE_DIR = os.getenv(
+    "S3_CACHE_DIR", os.path.join(tempfile.gettempdir(), "cagongjoke-s3")
+)
+S3_MAX_WORKERS = int(os.getenv("S3_MAX_WORKERS", "4"))
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+# LocalS3Client 클래스 정의: 파일 시스템을 S3처럼 사용하는 클라이언트
+# get_data_from_s3 등에서 사용하는 메소드만 구현
+class LocalS3Client:
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, bucket, key):
+        return os.path.join(self.root, bucket, key)
+
+    def head_object(self, Bucket, Key):
+        stat = os.stat(self._path(Bucket, Key))
+        etag = hashlib.md5(f"{stat.st_size}-{stat.st_mtime_ns}".encode()).hexdigest()
+        return {"ETag": f'"{etag}"', "ContentLength": stat.st_size}
+
+    def get_object(self, Bucket, Key, **kwargs):
+        return {"Body": open(self._path(Bucket, Key), "rb")}
+
+
+def get_s3_client():
+    # boto3 client는 thread-safe 하므로 프로세스 전체에서 하나를 공유 (커넥션 풀 재사용)
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                if S3_LOCAL_ROOT:
+                    _s3_client = LocalS3Client(S3_LOCAL_ROOT)
+                else:
+                    _s3_client = boto3.client(
+                        "s3",
+                        aws_access_key_id=AWS_ACCESS_KEY_ID,
+                        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+                        region_name=AWS_S3_REGION_NAME,
+                        endpoint_url=AWS_S3_ENDPOINT_URL,
+                    )
+    return _s3_client
+
+
+def set_s3_client(client):
+    # 공유 client 교체 (moto 등 테스트용 client 주입, None이면 다음 호출 시 재생성)
+    global _s3_client
+    with _s3_client_lock:
+        _s3_client = client
+
+
+def get_cache_path(bucket_name, file_key, etag, cache_dir=None):
+    # bucket/key/ETag로 주소가 정해지는 캐시 파일 경로
+    digest = hashlib.sha256(f"{bucket_name}/{file_key}/{etag}".encode()).hexdigest()
+    extension = os.path.splitext(file_key)[1]
+    return os.path.join(cache_dir or S3_CACHE_DIR, f"{digest}{extension}")
+
+
+def fetch_from_s3(bucket_name, file_key, cache_dir=None):
+    # 객체를 로컬 캐시에 내려받고 파일 경로를 반환 (같은 ETag면 다시 받지 않음)
+    s3 = get_s3_client()
+    etag = s3.head_object(Bucket=bucket_name, Key=file_key)["ETag"].strip('"')
+    path = get_cache_path(bucket_name, file_key, etag, cache_dir)
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+    try:
+        # get_object가 실패해도 fd가 닫히도록 먼저 파일 객체로 감쌈
+        with os.fdopen(fd, "wb") as f:
+            # 확인한 ETag와 다른 버전이 내려오지 않도록 IfMatch 지정
+            body = s3.get_object(Bucket=bucket_name, Key=file_key, IfMatch=etag)["Body"]
+            with body:
+                shutil.copyfileobj(body, f, DOWNLOAD_CHUNK_SIZE)
+        # 다른 프로세스가 같은 파일을 읽는 중이어도 안전하도록 원자적으로 교체
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def fetch_many_from_s3(bucket_name, file_keys, cache_dir=None, max_workers=None):
+    # 여러 객체를 스레드 풀로 병렬 다운로드하고 {key: 캐시 경로}를 반환
+    with ThreadPoolExecutor(max_workers=max_workers or S3_MAX_WORKERS) as executor:
+        paths = executor.map(
+            lambda file_key: fetch_from_s3(bucket_name, file_key, cache_dir),
+            file_keys,
+        )
+        return dict(zip(file_keys, paths))
 
 
 def get_data_from_s3(bucket_name, file_key):
-    s3 = boto3.client(
-        "s3",
-        aws_access_key_id=AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-        region_name=AWS_S3_REGION_NAME,
-    )
-    obj = s3.get_object(Bucket=bucket_name, Key=file_key)
-    data = obj["Body"].read()
-    return data
+    with open(fetch_from_s3(bucket_name, file_key), "rb") as f:
+        return f.read()
 
 
 def get_dataframe_from_s3(bucket_name, file_key):
-    data = get_data_from_s3(bucket_name, file_key)
-    return pd.read_parquet(BytesIO(data))
+    return pd.read_parquet(fetch_from_s3(bucket_name, file_key), memory_map=True)
+
+
+def iter_parquet_batches_from_s3(bucket_name, file_key, columns=None, batch_size=5000):
+    # 캐시 파일을 memory map으로 열어 row group 단위로 읽고
+    # 최대 batch_size 행의 pyarrow.RecordBatch를 순서대로 반환
+    parquet_file = pq.ParquetFile(fetch_from_s3(bucket_name, file_key), memory_map=True)
+    yield from parquet_file.iter_batches(batch_size=batch_size, columns=columns)
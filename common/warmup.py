@@ -0,0 +1,77 @@
+import inspect
+import logging
+import time
+from importlib import import_module
+
+from django.apps import apps
+from django.db import connections
+from django.urls import get_resolver
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+
+def warm_url_resolvers():
+    # URL 패턴 컴파일, reverse 테이블 생성
+    resolver = get_resolver()
+    resolver.reverse_dict
+    return len(resolver.url_patterns)
+
+
+def warm_serializers():
+    # 각 앱의 serializers 모듈을 불러오고 serializer 필드 구성을 한 번씩 만들어 둠
+    count = 0
+    for app_config in apps.get_app_configs():
+        if not app_config.name.startswith("apps."):
+            continue
+        try:
+            module = import_module(f"{app_config.name}.serializers")
+        except ModuleNotFoundError:
+            continue
+        for _, serializer_class in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(serializer_class, serializers.Serializer)
+                and serializer_class.__module__ == module.__name__
+            ):
+                try:
+                    serializer_class().fields
+                    count += 1
+                except Exception:
+                    # 생성 인자가 필요한 serializer 등은 건너뜀
+                    continue
+    return count
+
+
+def warm_schema():
+    # OpenAPI 스키마를 파일에서 읽거나 생성해 메모리에 올려 둠 (fork된 워커가 공유)
+    from config.openapi import schema_store
+
+    return len(schema_store.get("json").body)
+
+
+def warm_indexes():
+    # 지역/카페 검색 인덱스를 미리 만들어 둠 (워커가 첫 요청에서 빌드하지 않음)
+    from apps.cagong.area_index import get_area_index
+    from apps.cagong.cafe_index import get_cafe_index
+
+    get_area_index()
+    return len(get_cafe_index().items)
+
+
+def warm_up(log=logger.info):
+    # gunicorn preload 시 마스터 프로세스에서 한 번 실행 (fork된 워커는 결과를 공유)
+    # 마지막에 DB 연결을 닫아 워커들이 같은 소켓을 물려받지 않게 한다.
+    for name, step in (
+        ("url resolvers", warm_url_resolvers),
+        ("serializers", warm_serializers),
+        ("openapi schema", warm_schema),
+        ("search indexes", warm_indexes),
+    ):
+        start = time.perf_counter()
+        try:
+            result = step()
+        except Exception:
+            logger.exception("#### warm up %s 실패", name)
+            continue
+        log("#### warm up %s: %s (%.2fs)" % (name, result, time.perf_counter() - start))
+    connections.close_all()
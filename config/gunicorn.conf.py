@@ -0,0 +1,47 @@
+"""
+gunicorn config for cagongjoke project.
+
+    gunicorn -c config/gunicorn.conf.py config.wsgi
+
+ASGI(비동기 API 포함)로 실행하려면 GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker,
+앱은 config.asgi:application으로 지정합니다.
+"""
+
+import multiprocessing
+import os
+
+cpu_count = multiprocessing.cpu_count()
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# 워커 수: 기본값은 CPU 수 * 2 + 1 (gunicorn 권장값)
+workers = int(os.environ.get("GUNICORN_WORKERS", cpu_count * 2 + 1))
+# 스레드 수: 요청 대부분이 DB, 외부 API를 기다리는 I/O 대기이므로 워커마다 스레드를 둠
+# (threads > 1이면 gthread 워커 사용)
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+worker_class = os.environ.get(
+    "GUNICORN_WORKER_CLASS", "gthread" if threads > 1 else "sync"
+)
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+
+# 메모리 누수, 단편화 방지를 위해 일정 요청 수마다 워커 재시작 (jitter로 동시 재시작 방지)
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 200))
+
+# 마스터에서 앱을 한 번 불러오고 fork (워커 시작이 빠르고 메모리를 공유)
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() in ("1", "true")
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+
+def when_ready(server):
+    # 워커를 fork하기 직전: URL resolver, serializer, OpenAPI 스키마를 미리 준비
+    if preload_app:
+        from common.warmup import warm_up
+
+        warm_up(log=server.log.info)
@@ -0,0 +1,192 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+
+from django.apps import apps
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.urls import URLResolver, get_resolver
+from django.views.decorators.http import require_safe
+import drf_yasg
+from drf_yasg import openapi
+from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+re_accepts_gzip = re.compile(r"\bgzip\b")
+
+CONTENT_TYPES = {
+    "json": "application/json; charset=utf-8",
+    "yaml": "application/yaml; charset=utf-8",
+}
+
+api_info = openapi.Info(
+    title="SuddenAttack API",
+    default_version="v1",
+    description="SuddenAttack API Documentation",
+    terms_of_service="https://www.google.com/policies/terms/",
+    contact=openapi.Contact(email="ykh9871@gmail.com"),
+    license=openapi.License(name="ykh License"),
+)
+
+
+class CustomOpenAPISchemaGenerator(OpenAPISchemaGenerator):
+    def get_schema(self, request=None, public=False):
+        schema = super().get_schema(request, public)
+        schema.schemes = ["http", "https"]
+        schema.servers = [
+            {"url": "http://localhost:8000/", "description": "Local Server"},
+            {"url": "https://ohmolli.com:8000/", "description": "Dev Server"},
+        ]
+        return schema
+
+
+def iter_url_patterns(patterns, prefix=""):
+    # (전체 경로 패턴, 뷰 이름, 메서드 목록, 뷰 모듈)을 URLconf 순서대로 반환
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            yield from iter_url_patterns(pattern.url_patterns, route)
+            continue
+        callback = pattern.callback
+        view = getattr(callback, "cls", None) or getattr(callback, "view_class", None)
+        view = view or callback
+        methods = getattr(view, "http_method_names", [])
+        yield (
+            route,
+            f"{view.__module__}.{view.__qualname__}",
+            ",".join(m for m in methods if hasattr(view, m)),
+            view.__module__,
+        )
+
+
+def source_fingerprint(module_names):
+    # 모듈 소스와 drf_yasg 버전이 바뀌면 달라지는 값
+    digest = hashlib.sha256(drf_yasg.__version__.encode())
+    for name in sorted(module_names):
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if not path:
+            continue
+        with open(path, "rb") as f:
+            digest.update(name.encode() + b"\0" + f.read())
+    return digest.hexdigest()
+
+
+def urlconf_fingerprint():
+    # URL 경로, 뷰, 메서드, 스키마에 반영되는 소스가 하나라도 바뀌면 달라지는 값
+    # 경로가 같아도 뷰 모듈(swagger_auto_schema 인자, docstring)이나 앱의 serializer, 모델이
+    # 바뀌면 다시 생성한다. (어느 프로세스에서 계산해도 같은 모듈 목록을 사용)
+    entries = list(iter_url_patterns(get_resolver().url_patterns))
+    modules = {module for *_, module in entries}
+    for app_config in apps.get_app_configs():
+        if app_config.name.startswith("apps."):
+            modules.update(
+                f"{app_config.name}.{name}" for name in ("serializers", "models")
+            )
+    modules.add(__name__)
+    lines = ["\t".join(entry[:3]) for entry in entries]
+    lines.append(source_fingerprint(modules))
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()[:16]
+
+
+def generate_schema():
+    # 모든 뷰와 serializer를 검사해 스키마 생성 (요청과 무관한 public 스키마)
+    generator = CustomOpenAPISchemaGenerator(info=api_info)
+    schema = generator.get_schema(request=None, public=True)
+    return {
+        "json": OpenAPICodecJson(validators=[]).encode(schema),
+        "yaml": OpenAPICodecYaml(validators=[]).encode(schema),
+    }
+
+
+# SchemaDocument 클래스 정의: 응답에 바로 쓰는 스키마 본문, gzip 본문, ETag
+class SchemaDocument:
+    def __init__(self, body):
+        self.body = body
+        self.gzip_body = gzip.compress(body, compresslevel=9)
+        self.etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+
+
+# SchemaStore 클래스 정의: 스키마 파일을 읽어 프로세스 메모리에 보관
+# 파일에 기록된 URLconf, 소스 fingerprint가 현재와 같으면 파일을 그대로 쓰고,
+# 다르거나 파일이 없으면 한 번 생성해서 파일로 저장한다. (generate_openapi_schema 명령어와 같은 형식)
+class SchemaStore:
+    def __init__(self, directory):
+        self.directory = directory
+        self._documents = None
+        self._lock = threading.Lock()
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def get(self, format):
+        if self._documents is None:
+            with self._lock:
+                if self._documents is None:
+                    self._documents = self.load_or_generate()
+        return self._documents[format]
+
+    def load_or_generate(self):
+        fingerprint = urlconf_fingerprint()
+        bodies = self.load(fingerprint)
+        if bodies is None:
+            bodies = generate_schema()
+            self.write(bodies, fingerprint)
+        return {format: SchemaDocument(body) for format, body in bodies.items()}
+
+    def load(self, fingerprint):
+        try:
+            with open(self.path("schema.meta.json")) as f:
+                if json.load(f).get("fingerprint") != fingerprint:
+                    return None
+            bodies = {}
+            for format in CONTENT_TYPES:
+                with open(self.path(f"schema.{format}"), "rb") as f:
+                    bodies[format] = f.read()
+            return bodies
+        except (OSError, ValueError):
+            return None
+
+    def write(self, bodies, fingerprint):
+        # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        # 메타 파일을 마지막에 써서 스키마 파일이 모두 준비된 뒤에만 fingerprint가 일치하게 한다.
+        os.makedirs(self.directory, exist_ok=True)
+        files = [(f"schema.{format}", body) for format, body in bodies.items()]
+        files.append(
+            ("schema.meta.json", json.dumps({"fingerprint": fingerprint}).encode())
+        )
+        for name, body in files:
+            tmp_path = self.path(f".{name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, self.path(name))
+
+    def reset(self):
+        with self._lock:
+            self._documents = None
+
+
+schema_store = SchemaStore(settings.OPENAPI_SCHEMA_DIR)
+
+
+@require_safe
+def schema_file_view(request, format):
+    # swagger.json, swagger.yaml: 메모리의 스키마를 ETag, gzip과 함께 응답
+    format = format.lstrip(".")
+    document = schema_store.get(format)
+
+    if document.etag in request.headers.get("If-None-Match", ""):
+        response = HttpResponseNotModified()
+    elif re_accepts_gzip.search(request.headers.get("Accept-Encoding", "")):
+        response = HttpResponse(document.gzip_body, content_type=CONTENT_TYPES[format])
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(document.body, content_type=CONTENT_TYPES[format])
+    response["ETag"] = document.etag
+    response["Vary"] = "Accept-Encoding"
+    # 캐시는 허용하되 매번 ETag로 변경 여부 확인
+    response["Cache-Control"] = "no-cache"
+    return response
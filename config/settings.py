@@ -19,6 +19,22 @@ SOCIAL_AUTH_GOOGLE_CLIENT_ID = env("SOCIAL_AUTH_GOOGLE_CLIENT_ID")
 
 SOCIAL_AUTH_GOOGLE_SECRET = env("SOCIAL_AUTH_GOOGLE_SECRET")
 
+# Google OAuth API 주소 (로컬에서는 apps/users/fake_google.py 서버 주소로 바꿔 사용)
+GOOGLE_OAUTH_TOKEN_URL = env(
+    "GOOGLE_OAUTH_TOKEN_URL", default="https://oauth2.googleapis.com/token"
+)
+GOOGLE_OAUTH_USERINFO_URL = env(
+    "GOOGLE_OAUTH_USERINFO_URL",
+    default="https://www.googleapis.com/oauth2/v1/userinfo",
+)
+
+# OAuth 공급자 호출 타임아웃(초), 재시도 횟수, 재시도 간격 계수, 연결 풀 크기
+OAUTH_CONNECT_TIMEOUT = env.float("OAUTH_CONNECT_TIMEOUT", default=3.05)
+OAUTH_READ_TIMEOUT = env.float("OAUTH_READ_TIMEOUT", default=5)
+OAUTH_RETRIES = env.int("OAUTH_RETRIES", default=2)
+OAUTH_RETRY_BACKOFF = env.float("OAUTH_RETRY_BACKOFF", default=0.2)
+OAUTH_POOL_MAXSIZE = env.int("OAUTH_POOL_MAXSIZE", default=10)
+
 ALLOWED_HOSTS = ["*"]
 
 SWAGGER_SETTINGS = {
@@ -32,8 +48,17 @@ SWAGGER_SETTINGS = {
         }
     },
     "SECURITY_REQUIREMENTS": [{"BearerAuth": []}],
+    # 화면마다 스키마를 새로 생성하지 않고 미리 만들어 둔 swagger.json 사용
+    "SPEC_URL": ("schema-json", {"format": ".json"}),
 }
 
+REDOC_SETTINGS = {
+    "SPEC_URL": ("schema-json", {"format": ".json"}),
+}
+
+# generate_openapi_schema 명령어가 스키마 파일(schema.json, schema.yaml)을 저장하는 위치
+OPENAPI_SCHEMA_DIR = env("OPENAPI_SCHEMA_DIR", default="/tmp/cagongjoke-openapi")
+
 INSTALLED_APPS = [
     "django.contrib.admin",
     "django.contrib.auth",
@@ -42,6 +67,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
     # 설치한 라이브러리
     "rest_framework",
     "drf_yasg",
@@ -73,7 +99,7 @@ ACCOUNT_AUTHENTICATION_METHOD = "email"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,  # 페이지당 항목 수를 10으로 설정
@@ -98,7 +124,8 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": False,
     "BLACKLIST_AFTER_ROTATION": False,
-    "UPDATE_LAST_LOGIN": True,
+    # last_login은 apps.users.last_login에서 모아서 기록
+    "UPDATE_LAST_LOGIN": False,
     "ALGORITHM": "HS256",
     "SIGNING_KEY": SECRET_KEY,
     "VERIFYING_KEY": None,
@@ -149,6 +176,8 @@ CORS_ALLOWED_ORIGINS = [
 ]
 
 MIDDLEWARE = [
+    # /healthz, /readyz는 세션, 인증 등 다른 미들웨어를 거치지 않고 바로 응답
+    "common.middleware.HealthCheckMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -195,9 +224,44 @@ DATABASES = {
         "USER": env("POSTGRES_USER"),
         "PASSWORD": env("POSTGRES_PASSWORD"),
         "HOST": env("POSTGRES_HOST"),
+        # 요청마다 새로 연결하지 않고 CONN_MAX_AGE초 동안 연결 재사용 (0이면 요청마다 종료)
+        # 동기(gunicorn gthread) 서버 기준 값: 스레드마다 연결을 하나씩 유지하므로
+        # 서버 수 × GUNICORN_WORKERS × GUNICORN_THREADS 가 Postgres max_connections보다 작아야 한다.
+        # ASGI 서버는 요청마다 다른 스레드에서 연결을 열어 재사용되지 않으므로 0으로 실행 (docker-compose)
+        "CONN_MAX_AGE": env.int("CONN_MAX_AGE", default=60),
+        # 재사용 전 연결이 살아 있는지 확인 (DB 재시작 후 끊긴 연결로 인한 오류 방지)
+        "CONN_HEALTH_CHECKS": env.bool("CONN_HEALTH_CHECKS", default=True),
     }
 }
 
+# Cache
+# 웹 워커와 관리 명령어(crawlareas 등)가 버전 정보를 공유할 수 있도록 기본값은 파일 기반 캐시
+# (파일 캐시는 항목이 MAX_ENTRIES를 넘으면 일부를 지우므로, 버전 키가 지워지면 인덱스를 다시 만든다.)
+# 여러 서버에서 공유하려면 CACHE_URL=rediscache://... 형태로 지정
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="filecache:///tmp/cagongjoke-cache"),
+}
+
+# 카페 찜 수, 리뷰 수 일괄 조회 캐시 유지 시간(초), 0이면 캐시 사용 안 함
+# 파일 캐시는 키마다 파일을 쓰므로 PK 조회보다 느리고 버전 키 등 다른 항목을 밀어내므로
+# 공유 메모리 캐시(redis, memcached)를 쓸 때만 기본으로 사용
+SHARED_MEMORY_CACHE_BACKENDS = ("RedisCache", "PyMemcacheCache", "PyLibMCCache")
+CAFE_COUNTS_CACHE_TIMEOUT = env.int(
+    "CAFE_COUNTS_CACHE_TIMEOUT",
+    default=5 if CACHES["default"]["BACKEND"].endswith(SHARED_MEMORY_CACHE_BACKENDS) else 0,
+)
+
+# JWT 인증 시 사용자 조회 캐시 (apps.users.user_cache)
+# USER_CACHE_ALIAS를 비우면 프로세스 메모리 캐시만 사용 (다른 프로세스의 회원 정보 변경은 TIMEOUT 후 반영)
+USER_CACHE_SIZE = env.int("USER_CACHE_SIZE", default=10000)
+USER_CACHE_TIMEOUT = env.int("USER_CACHE_TIMEOUT", default=60)
+USER_CACHE_ALIAS = env("USER_CACHE_ALIAS", default="default") or None
+
+# 로그인 시각(last_login)을 모아서 DB에 기록하는 주기(초), 0이면 로그인마다 바로 기록
+# 기록 대기 중인 시각은 USER_CACHE_ALIAS 캐시에 공유 (관리자 화면의 "last_login (기록 대기)")
+LAST_LOGIN_FLUSH_INTERVAL = env.int("LAST_LOGIN_FLUSH_INTERVAL", default=10)
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
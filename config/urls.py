@@ -2,30 +2,11 @@ from django.contrib import admin
 from django.urls import path, re_path, include
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-from drf_yasg.generators import OpenAPISchemaGenerator
-
-
-class CustomOpenAPISchemaGenerator(OpenAPISchemaGenerator):
-    def get_schema(self, request=None, public=False):
-        schema = super().get_schema(request, public)
-        schema.schemes = ["http", "https"]
-        schema.servers = [
-            {"url": "http://localhost:8000/", "description": "Local Server"},
-            {"url": "https://ohmolli.com:8000/", "description": "Dev Server"},
-        ]
-        return schema
+from config.openapi import api_info, CustomOpenAPISchemaGenerator, schema_file_view
 
 
 schema_view = get_schema_view(
-    openapi.Info(
-        title="SuddenAttack API",
-        default_version="v1",
-        description="SuddenAttack API Documentation",
-        terms_of_service="https://www.google.com/policies/terms/",
-        contact=openapi.Contact(email="ykh9871@gmail.com"),
-        license=openapi.License(name="ykh License"),
-    ),
+    api_info,
     public=True,
     permission_classes=(permissions.AllowAny,),
     generator_class=CustomOpenAPISchemaGenerator,
@@ -34,11 +15,15 @@ schema_view = get_schema_view(
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/cagong/", include("apps.cagong.urls")),
+    # 읽기 전용 API의 비동기 버전 (uvicorn 등 ASGI 서버로 실행할 때 사용)
+    path("api/async/cagong/", include("apps.cagong.async_urls")),
     path("api/user/", include("apps.users.urls")),
     path("api/user/", include("allauth.urls")),
+    # 스키마는 한 번 생성해서 메모리에 보관 (config/openapi.py)
+    # swagger-ui, redoc 화면도 이 주소의 스키마를 사용 (SWAGGER_SETTINGS, REDOC_SETTINGS의 SPEC_URL)
     re_path(
         r"^swagger(?P<format>\.json|\.yaml)$",
-        schema_view.without_ui(cache_timeout=0),
+        schema_file_view,
         name="schema-json",
     ),
     re_path(